@@ -0,0 +1,14 @@
+// Decay database from data/decays.py (keys match node_id values)
+const decayData = {"p":{"stable":true,"lifetime":"> 10³⁴ years"},"n":{"lifetime":"~879 s (15 min)","note":"Longest weak decay! Tiny Q-value (782 keV).","modes":[{"products":"p + e⁻ + ν̄ₑ","percent":100,"type":"weak"}]},"D":{"lifetime":"~5×10⁻²⁴ s","note":"Resonance, decays via strong force","modes":[{"products":"N + π","percent":99.4,"type":"strong"},{"products":"N + γ","percent":0.6,"type":"em"}]},"L0":{"lifetime":"2.6×10⁻¹⁰ s","modes":[{"products":"p + π⁻","percent":63.9,"type":"weak"},{"products":"n + π⁰","percent":35.8,"type":"weak"}]},"S_plus":{"lifetime":"0.80×10⁻¹⁰ s","modes":[{"products":"p + π⁰","percent":51.6,"type":"weak"},{"products":"n + π⁺","percent":48.3,"type":"weak"}]},"S_zero":{"lifetime":"7.4×10⁻²⁰ s","note":"EM decay! Only ground-state baryon.","modes":[{"products":"Λ + γ","percent":100,"type":"em"}]},"S_minus":{"lifetime":"1.48×10⁻¹⁰ s","modes":[{"products":"n + π⁻","percent":99.8,"type":"weak"}]},"Ss_plus":{"lifetime":"~1.7×10⁻²³ s","modes":[{"products":"Λ + π⁺","percent":87,"type":"strong"},{"products":"Σ + π","percent":12,"type":"strong"}]},"Ss_zero":{"lifetime":"~1.7×10⁻²³ s","modes":[{"products":"Λ + π⁰","percent":87,"type":"strong"},{"products":"Σ + π","percent":12,"type":"strong"}]},"Ss_minus":{"lifetime":"~1.7×10⁻²³ s","modes":[{"products":"Λ + π⁻","percent":87,"type":"strong"},{"products":"Σ + π","percent":12,"type":"strong"}]},"X_zero":{"lifetime":"2.9×10⁻¹⁰ s","modes":[{"products":"Λ + π⁰","percent":99.5,"type":"weak"}]},"X_minus":{"lifetime":"1.6×10⁻¹⁰ s","modes":[{"products":"Λ + π⁻","percent":99.9,"type":"weak"}]},"Xs_zero":{"lifetime":"~7×10⁻²³ s","modes":[{"products":"Ξ + π","percent":100,"type":"strong"}]},"Xs_minus":{"lifetime":"~7×10⁻²³ s","modes":[{"products":"Ξ + π","percent":100,"type":"strong"}]},"Om":{"lifetime":"0.82×10⁻¹⁰ s","note":"Spin-3/2 but NO strong decay!","modes":[{"products":"Λ + K⁻","percent":67.8,"type":"weak"},{"products":"Ξ⁰ + π⁻","percent":23.6,"type":"weak"},{"products":"Ξ⁻ + π⁰","percent":8.6,"type":"weak"}]},"Lc":{"lifetime":"2.0×10⁻¹³ s","modes":[{"products":"Λ + π⁺ + ...","percent":35,"type":"weak"},{"products":"pK̄⁰","percent":3.2,"type":"weak"}]},"Lb":{"lifetime":"1.5×10⁻¹² s","note":"Longest-lived bottom baryon","modes":[{"products":"Λc⁺ + π⁻","percent":0.5,"type":"weak"},{"products":"Λc⁺ + π⁻ + π⁺ + π⁻","percent":2.6,"type":"weak"},{"products":"J/ψ + Λ","percent":0.04,"type":"weak"},{"products":"p + π⁻","percent":0.0004,"type":"weak"}]},"Sc_pp":{"lifetime":"~2×10⁻²² s","note":"Strong decay to Λc⁺","modes":[{"products":"Λc⁺ + π⁺","percent":100,"type":"strong"}]},"Sc_plus":{"lifetime":"~5×10⁻²¹ s","note":"EM decay (isospin forbids strong)","modes":[{"products":"Λc⁺ + γ","percent":100,"type":"em"}]},"Sc_zero":{"lifetime":"~2×10⁻²² s","note":"Strong decay to Λc⁺","modes":[{"products":"Λc⁺ + π⁻","percent":100,"type":"strong"}]},"Scs_pp":{"lifetime":"~5×10⁻²³ s","modes":[{"products":"Λc⁺ + π⁺","percent":100,"type":"strong"}]},"Scs_plus":{"lifetime":"~5×10⁻²³ s","modes":[{"products":"Λc⁺ + π⁰","percent":100,"type":"strong"}]},"Scs_zero":{"lifetime":"~5×10⁻²³ s","modes":[{"products":"Λc⁺ + π⁻","percent":100,"type":"strong"}]},"Xc_plus":{"lifetime":"4.6×10⁻¹³ s","modes":[{"products":"Ξ⁻ + π⁺ + π⁺","percent":2.9,"type":"weak"},{"products":"pK⁻π⁺","percent":1.1,"type":"weak"}]},"Xc_zero":{"lifetime":"1.5×10⁻¹³ s","note":"Shorter-lived than Ξc⁺","modes":[{"products":"Ξ⁻ + π⁺","percent":1.8,"type":"weak"},{"products":"pK⁻K⁻π⁺","percent":0.6,"type":"weak"}]},"Xcs_plus":{"lifetime":"~3×10⁻²¹ s","modes":[{"products":"Ξc⁰ + π⁺","percent":50,"type":"strong"},{"products":"Ξc⁺ + π⁰","percent":50,"type":"strong"}]},"Xcs_zero":{"lifetime":"~3×10⁻²¹ s","modes":[{"products":"Ξc⁺ + π⁻","percent":50,"type":"strong"},{"products":"Ξc⁰ + π⁰","percent":50,"type":"strong"}]},"Oc_zero":{"lifetime":"2.7×10⁻¹³ s","modes":[{"products":"Ω⁻ + π⁺","percent":0.5,"type":"weak"},{"products":"Ξ⁰ + K⁻ + π⁺","percent":0.5,"type":"weak"}]},"Ocs_zero":{"lifetime":"~10⁻²¹ s","modes":[{"products":"Ωc⁰ + γ","percent":100,"type":"em"}]},"Xcc":{"lifetime":"2.6×10⁻¹³ s","note":"Double charm baryon","modes":[{"products":"Λc⁺ + K⁻ + π⁺ + π⁺","percent":5.9,"type":"weak"},{"products":"Ξc⁺ + π⁺","percent":1.0,"type":"weak"}]},"Sb_plus":{"lifetime":"~6×10⁻²² s","note":"Strong decay to Λb⁰","modes":[{"products":"Λb⁰ + π⁺","percent":100,"type":"strong"}]},"Sb_minus":{"lifetime":"~6×10⁻²² s","note":"Strong decay to Λb⁰","modes":[{"products":"Λb⁰ + π⁻","percent":100,"type":"strong"}]},"Sbs_plus":{"lifetime":"~10⁻²⁰ s","note":"EM decay (20 MeV splitting)","modes":[{"products":"Σb⁺ + γ","percent":100,"type":"em"}]},"Sbs_minus":{"lifetime":"~10⁻²⁰ s","note":"EM decay (19 MeV splitting)","modes":[{"products":"Σb⁻ + γ","percent":100,"type":"em"}]},"Xb_zero":{"lifetime":"1.5×10⁻¹² s","modes":[{"products":"Ξc⁺ + π⁻","percent":1.0,"type":"weak"},{"products":"J/ψ + Ξ⁰","percent":0.1,"type":"weak"}]},"Xb_minus":{"lifetime":"1.6×10⁻¹² s","modes":[{"products":"Ξc⁰ + π⁻","percent":1.0,"type":"weak"},{"products":"J/ψ + Ξ⁻","percent":0.1,"type":"weak"}]},"Ob":{"lifetime":"1.6×10⁻¹² s","note":"Bottom + double strange","modes":[{"products":"J/ψ + Ω⁻","percent":0.3,"type":"weak"},{"products":"Ωc⁰ + π⁻","percent":0.5,"type":"weak"}]}};
+
+// Magnetic moments from data/magnetic.py
+const magMoments = {
+    'p': { formula: '8π/9', value: 2.792527, exp: 2.7928473508, unit: 'μN', sign: '' },
+    'S_plus': { formula: '7π/9', value: 2.443461, exp: 2.458, unit: 'μN', sign: '' },
+    'n': { formula: '6/π', value: 1.909859, exp: 1.9130427, unit: 'μN', sign: '-' },
+    'L0': { formula: '6/π²', value: 0.607927, exp: 0.613, unit: 'μN', sign: '-' },
+    'X_zero': { formula: '4/π', value: 1.273240, exp: 1.25, unit: 'μN', sign: '-' },
+    'S_minus': { formula: '36/π³', value: 1.161055, exp: 1.16, unit: 'μN', sign: '-' },
+    'X_minus': { formula: '20/π³', value: 0.645031, exp: 0.6507, unit: 'μN', sign: '-' },
+    'Om': { formula: '20/π²', value: 2.026424, exp: 2.02, unit: 'μN', sign: '-' }
+};
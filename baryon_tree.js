@@ -0,0 +1,242 @@
+let cy, currentTab = 'light';
+// One Cytoscape instance per tab, created on first visit
+const cyInstances = {};
+
+// Each tab's data sits in its own JSON block, parsed when the tab is
+// first shown. Labels, node types, edge ids and positions are all set
+// by the generator: edges are ready as is, and node rows only need
+// turning back into { data, position } objects, with the type index
+// swapped for its name and the position taken from its own list.
+function loadElements(tab) {
+    const data = JSON.parse(document.getElementById('data-' + tab).textContent);
+    const { schema, types, rows, positions } = data.nodes;
+    const nodes = rows.map((r, j) => {
+        const n = Object.fromEntries(schema.map((k, i) => [k, r[i]]));
+        n.type = types[n.type];
+        const [x, y] = positions[j];
+        return { data: n, position: { x, y } };
+    });
+    return { nodes, edges: data.edges };
+}
+
+function initCy(tab) {
+    const container = document.createElement('div');
+    document.getElementById('cy').appendChild(container);
+    cy = cytoscape({
+        container: container,
+        renderer: cyRenderer,
+        elements: loadElements(tab),
+        style: [
+            { selector: 'node', style: {
+                'label': 'data(label)', 'text-valign': 'center', 'text-halign': 'center',
+                'font-size': '20px', 'color': '#fff', 'text-wrap': 'wrap',
+                'border-width': 2, 'border-color': '#fff'
+            } },
+            { selector: 'node[type="particle"], node[type="spin32"]', style: {
+                'font-weight': 'bold', 'text-max-width': '150px',
+                'shape': 'round-rectangle', 'width': 130, 'height': 60, 'background-color': '#3498db'
+            } },
+            { selector: 'node[type="spin32"]', style: { 'background-color': '#e74c3c' } },
+            { selector: 'node[type="virtual"]', style: {
+                'shape': 'ellipse', 'width': 85, 'height': 85, 'background-color': '#9b59b6', 'border-style': 'dashed'
+            } },
+            { selector: 'node[type="virtual-coeff"]', style: {
+                'shape': 'hexagon', 'width': 95, 'height': 95, 'background-color': '#8e44ad'
+            } },
+            { selector: 'edge', style: { 'width': 2, 'line-color': '#555', 'target-arrow-color': '#555', 'target-arrow-shape': 'triangle', 'curve-style': 'bezier' } },
+            { selector: 'node:selected', style: { 'border-color': '#00d9ff', 'border-width': 5 } }
+        ],
+        layout: { name: 'preset', fit: true, padding: 30 }
+    });
+    cyInstances[tab] = cy;
+    cy.on('tap', 'node', e => showInfo(e.target.data()));
+    cy.on('tap', e => { if(e.target === cy) document.getElementById('info').innerHTML = '<p style="color:#666">Click a node</p>'; });
+
+    // Set default zoom per tab
+    if (tab === 'bottom') {
+        cy.zoom(0.8);
+        cy.center();
+    }
+}
+
+function getSigmaColor(sigma) {
+    if (sigma < 1) return '#2ecc71';      // green
+    if (sigma < 2) return '#3498db';      // blue
+    if (sigma < 3) return '#f39c12';      // orange
+    return '#e74c3c';                      // red
+}
+
+function showInfo(d) {
+    if (d.type === 'virtual' || d.type === 'virtual-coeff') {
+        // Get resonances for this virtual node
+        const resKeys = nodeResonances[d.id] || [];
+        let resHtml = '';
+
+        if (resKeys.length > 0) {
+            resHtml = `<hr style="border-color:#333; margin:12px 0">
+                <div style="color:#e74c3c; font-size:0.9em; margin-bottom:8px;">RESONANCES</div>`;
+
+            for (const key of resKeys) {
+                const res = resonances[key];
+                if (res) {
+                    const errorSign = res.error_kev >= 0 ? '+' : '';
+                    resHtml += `
+                        <div style="margin-bottom:12px; padding:10px; background:#252540; border-radius:4px;">
+                            <div style="font-size:1.4em; color:#fff; margin-bottom:4px;">${res.symbol} <span style="font-size:0.5em; color:#888; margin-left:4px;">${res.jp}</span></div>
+                            <div style="font-size:1.0em; margin-bottom:4px; display:flex; justify-content:space-between;">
+                                <span class="formula">${res.formula}</span>
+                                <span style="color:#888">${res.calc_mev.toFixed(2)}</span>
+                            </div>
+                            <div style="font-size:0.85em; color:#888; margin-bottom:6px;">
+                                <span>Exp: ${res.exp_mev} MeV</span>
+                                <span style="margin-left:12px; color:${Math.abs(res.error_kev) < 50 ? '#2ecc71' : '#f39c12'}">${errorSign}${res.error_kev.toFixed(1)} keV</span>
+                            </div>
+                            <div style="font-size:0.85em; color:#888; margin-bottom:6px;">
+                                <span>Width Γ = ${res.width} MeV</span>
+                            </div>
+                            <div style="font-size:0.8em; color:#f39c12; font-style:italic; line-height:1.4;">${res.anomaly}</div>
+                        </div>`;
+                }
+            }
+        }
+
+        // Get mesons for this virtual node
+        const mesonKeys = nodeMesons[d.id] || [];
+        let mesonHtml = '';
+
+        if (mesonKeys.length > 0) {
+            mesonHtml = `<hr style="border-color:#333; margin:12px 0">
+                <div style="color:#2ecc71; font-size:0.9em; margin-bottom:8px;">MESONS</div>`;
+
+            for (const key of mesonKeys) {
+                const m = mesons[key];
+                if (m) {
+                    const errorSign = m.error_kev >= 0 ? '+' : '';
+                    mesonHtml += `
+                        <div style="margin-bottom:12px; padding:10px; background:#1a3a2a; border-radius:4px; border-left:3px solid #2ecc71;">
+                            <div style="font-size:1.4em; color:#fff; margin-bottom:4px;">${m.symbol} <span style="font-size:0.6em; color:#888; margin-left:4px;">${m.quark_content}</span></div>
+                            <div style="font-size:1.0em; margin-bottom:4px; display:flex; justify-content:space-between;">
+                                <span class="formula">${m.formula}</span>
+                                <span style="color:#888">${m.calc_mev.toFixed(2)}</span>
+                            </div>
+                            <div style="font-size:0.85em; color:#888; margin-bottom:6px;">
+                                <span>Exp: ${m.exp_mev} MeV</span>
+                                <span style="margin-left:12px; color:${Math.abs(m.error_kev) < 500 ? '#2ecc71' : '#f39c12'}">${errorSign}${m.error_kev.toFixed(1)} keV</span>
+                            </div>
+                        </div>`;
+                }
+            }
+        }
+
+        document.getElementById('info').innerHTML = `
+            <div style="font-size:1.8em; margin-bottom:5px; color:#fff">${d.label}</div>
+            <div style="font-size:1.3em; margin-bottom:8px;"><span class="formula">${d.formula || d.label}</span></div>
+            <div style="color:#888; font-size:0.9em;">${d.description || ''}</div>
+            ${resHtml}
+            ${mesonHtml}`;
+    } else {
+        const fullFormula = d.correction ? d.formula + ' ' + d.correction : d.formula;
+        // Use pre-calculated values from Python
+        const calcMev = d.calc_mev || 0;
+        const expMev = d.actual_mev || 0;
+        const errorKev = d.error_kev || 0;
+        const unc = d.uncertainty || 1.0;
+        const sigma = d.sigma || 0;
+        const sigmaColor = getSigmaColor(sigma);
+        const sigmaText = sigma < 100 ? sigma.toFixed(2) + 'σ' : '>100σ';
+        const errorSign = errorKev >= 0 ? '+' : '';
+
+        // Build magnetic moment section if data exists
+        let magHtml = '';
+        const mm = magMoments[d.id];
+        if (mm) {
+            const magError = ((mm.value - mm.exp) / mm.exp * 100).toFixed(2);
+            magHtml = `
+                <hr style="border-color: #333; margin: 12px 0;">
+                <div style="color: #f39c12; font-size: 0.9em; margin-bottom: 5px;">MAGNETIC MOMENT</div>
+                <div><span class="label">μ formula:</span> <span style="color: #f39c12;">${mm.formula}</span></div>
+                <div><span class="label">Calculated:</span> ${mm.sign}${mm.value.toFixed(3)} ${mm.unit}</div>
+                <div><span class="label">Experimental:</span> ${mm.sign}${mm.exp} ${mm.unit}</div>
+                <div><span class="label">Error:</span> ${magError}%</div>
+            `;
+        }
+
+        const baseMev = d.base_mev || 0;
+        const corrMev = d.corr_mev || 0;
+        const hasCorr = d.correction && corrMev !== 0;
+
+        document.getElementById('info').innerHTML = `
+            <div style="font-size:1.8em; margin-bottom:5px; color:#fff">${d.label.split('\n')[0]} <span style="font-size:0.55em; color:#888; margin-left:6px">${d.quarks ? '(' + d.quarks + ')' : ''} ${d.spin}<sup>${d.charge > 0 ? '+' : d.charge < 0 ? '−' : '0'}</sup></span></div>
+            <div style="font-size:1.1em; margin-bottom:4px; display:flex; justify-content:space-between;">
+                <span class="formula">${d.formula}</span>
+                <span style="color:#888; margin-left:12px">${baseMev.toFixed(2)}</span>
+            </div>
+            ${hasCorr ? `<div style="font-size:1.1em; margin-bottom:8px; display:flex; justify-content:space-between;">
+                <span class="formula">${d.correction}</span>
+                <span style="color:#888; margin-left:12px">${corrMev >= 0 ? '+' : ''}${corrMev.toFixed(2)}</span>
+            </div>` : ''}
+            <hr style="border-color:#333; margin:12px 0">
+            <div><span class="label">Calculated:</span> <span class="value">${calcMev.toFixed(4)} MeV</span></div>
+            <div><span class="label">Experimental:</span> <span class="value">${expMev.toFixed(4)} MeV</span></div>
+            <div><span class="label">Uncertainty:</span> <span class="value">±${unc < 0.001 ? (unc*1e6).toFixed(2) + ' eV' : unc < 1 ? (unc*1000).toFixed(1) + ' keV' : unc.toFixed(2) + ' MeV'}</span></div>
+            <hr style="border-color:#333; margin:12px 0">
+            <div><span class="label">Error:</span> <span style="color:${sigmaColor}">${errorSign}${Math.abs(errorKev) < 1 ? (errorKev*1000).toFixed(1) + ' eV' : errorKev.toFixed(2) + ' keV'}</span></div>
+            <div><span class="label">Deviation:</span> <span style="color:${sigmaColor}; font-weight:bold">${sigmaText}</span></div>
+            ${magHtml}`;
+
+        updateDecays(d.id);
+    }
+}
+
+function switchTab(tab) {
+    currentTab = tab;
+    document.querySelectorAll('.main-tab').forEach(t => t.classList.remove('active'));
+    event.target.classList.add('active');
+    // Before Cytoscape has loaded, just remember the tab; the first
+    // instance is created for currentTab on DOMContentLoaded
+    if (!cy) return;
+    // The side panels are reset below, so drop the selection on the
+    // instance being hidden; it would be stale when the tab is reopened
+    cy.elements().unselect();
+    cy.container().style.display = 'none';
+    if (cyInstances[tab]) {
+        cy = cyInstances[tab];
+        cy.container().style.display = '';
+        cy.resize();
+    } else {
+        initCy(tab);
+    }
+    document.getElementById('info').innerHTML = '<p style="color:#666">Click a node</p>';
+    document.getElementById('decays').innerHTML = '<p style="color:#666">Select a particle to see decay modes</p>';
+}
+
+function updateDecays(id) {
+    const decay = decayData[id];
+    let html = '';
+
+    if (!decay) {
+        html = '<p style="color: #666;">No decay data for this particle</p>';
+    } else if (decay.stable) {
+        html = `<div style="color: #2ecc71; font-size: 1.1em;">STABLE</div>
+                <div style="color: #888; margin-top: 5px;">τ ${decay.lifetime}</div>`;
+    } else {
+        html = `<div style="color: #888; margin-bottom: 10px;">τ = ${decay.lifetime}</div>`;
+        if (decay.note) {
+            html += `<div style="color: #f39c12; margin-bottom: 10px; font-size: 0.9em;">${decay.note}</div>`;
+        }
+        decay.modes.forEach(m => {
+            const percent = typeof m.percent === 'number' ? m.percent.toFixed(1) + '%' : m.percent;
+            html += `
+                <div class="decay-mode ${m.type}">
+                    <span class="decay-percent">${percent}</span>
+                    ${m.products}
+                </div>
+            `;
+        });
+    }
+
+    document.getElementById('decays').innerHTML = html;
+}
+
+// Cytoscape is loaded with defer, so wait for it before drawing
+window.addEventListener('DOMContentLoaded', () => initCy(currentTab));
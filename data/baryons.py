@@ -47,11 +47,11 @@ class Particle:
     node_id: str          # Unique ID for tree visualization (ASCII only)
 
     # Polynomial coefficients (π^n where n >= 2)
-    c6: float = 0
-    c5: float = 0
-    c4: float = 0
-    c3: float = 0
-    c2: float = 0
+    c6: int = 0
+    c5: int = 0
+    c4: int = 0
+    c3: int = 0
+    c2: int = 0
 
     # Correction (sub-π² terms)
     correction_func: Optional[Callable[[], float]] = None
@@ -10,9 +10,14 @@ Tree structure based on shared coefficients:
 Particles sharing coefficients are grouped under virtual nodes.
 """
 
+import io
 import math
 import json
+import os
 import re
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 from data.baryons import (
     PARTICLES, CHARM_PARTICLES, BOTTOM_PARTICLES, DOUBLE_CHARM_PARTICLES,
     PI, PI2, PI3, PI4, PI5, PI6, M_E
@@ -21,12 +26,16 @@ from data.magnetic import MAGNETIC_MOMENTS
 from data.resonances import RESONANCES
 from data.mesons import MESONS
 from data.cycle import LIGHT_CYCLE, CHARM_CYCLE, BOTTOM_CYCLE
+from data.decays import DECAYS
 
 # Combine all particle dicts for easy access
 ALL_PARTICLES = {**PARTICLES, **CHARM_PARTICLES, **BOTTOM_PARTICLES, **DOUBLE_CHARM_PARTICLES}
 
-# Build node_id to key mapping from the particle data
-NODE_ID_TO_KEY = {p.node_id: key for key, p in ALL_PARTICLES.items()}
+# Mass columns for the whole catalog (in m_e), evaluated once up front
+# instead of re-running the polynomial and correction for every node
+MASS_BASE = {key: p.mass_base() for key, p in ALL_PARTICLES.items()}
+CORRECTION = {key: p.correction() for key, p in ALL_PARTICLES.items()}
+RESIDUAL_ME = {key: p.mass_exp / M_E - MASS_BASE[key] for key, p in ALL_PARTICLES.items()}
 
 # Build mapping from node_id to cycle node data
 CYCLE_NODES = {}
@@ -40,11 +49,11 @@ def get_cycle_node(node_id):
     return node.get('label', node_id), node.get('sublabel', '')
 
 # Map magnetic moment keys to particle keys (magnetic.py uses different naming)
-MAG_KEY_TO_PARTICLE = {
+MAG_KEY_TO_PARTICLE = MappingProxyType({
     'p': 'proton', 'n': 'neutron', 'Lambda': 'Lambda',
     'Sigma+': 'Sigma_plus', 'Sigma-': 'Sigma_minus',
     'Xi0': 'Xi_zero', 'Xi-': 'Xi_minus', 'Omega': 'Omega'
-}
+})
 
 
 def generate_magnetic_moments_js():
@@ -73,7 +82,7 @@ def generate_magnetic_moments_js():
             formula = f"{abs(mm.numerator)}/π^{mm.pi_power}"
 
         sign = "'-'" if mm.mu_exp < 0 else "''"
-        lines.append(f"            '{node_id}': {{ formula: '{formula}', value: {abs(mm.mu_calc()):.6f}, exp: {abs(mm.mu_exp)}, unit: 'μN', sign: {sign} }}")
+        lines.append(f"    '{node_id}': {{ formula: '{formula}', value: {abs(mm.mu_calc()):.6f}, exp: {abs(mm.mu_exp)}, unit: 'μN', sign: {sign} }}")
 
     return ',\n'.join(lines)
 
@@ -191,8 +200,8 @@ def generate_node_mesons_js():
     return ',\n'.join(lines)
 
 
-# Experimental uncertainties in MeV (from PDG)
-UNCERTAINTIES = {
+# Experimental uncertainties in MeV (from PDG), read-only
+UNCERTAINTIES = MappingProxyType({
     'proton': 0.00000029e-3,  # proton: ultra-precise
     'neutron': 0.00000054e-3,  # neutron: ultra-precise
     'Lambda': 0.006,
@@ -230,34 +239,74 @@ UNCERTAINTIES = {
     'Xi_b_zero': 0.4,
     'Xi_b_minus': 0.4,
     'Omega_b': 0.22,
+})
+
+
+_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def _dump(obj, fp):
+    """Serialize a payload into the generated page.
+
+    The JSON is only read by the browser, so it is written compactly and
+    symbols like Λ and π go out as UTF-8 rather than \\u escapes. It ends
+    up inside a <script> element, so "</" is escaped to keep a string from
+    closing it.
+    """
+    for chunk in _ENCODER.iterencode(obj):
+        fp.write(chunk.replace('</', '<\\/'))
+
+
+# Corrections with a one-off form, mapped straight to their display string
+_EXACT_DISPLAY = {
+    r'-\frac{6}{5}\left(\pi - e^{-\pi}\right)': '-(6/5)(π - e⁻ᵖⁱ)',          # Omega
+    r'\frac{1}{5}\left(\pi - 2 + 4e^{-\pi}\right)': '(1/5)(π - 2 + 4e⁻ᵖⁱ)',  # Delta
+    r'\frac{1}{5}\left(\pi - 7 - e^{-\pi}\right)': '(1/5)(π - 7 - e⁻ᵖⁱ)',    # Sigma_star_plus
+    r'-\pi - \frac{1}{\pi}': '-π - 1/π',                                    # Xi0
+    r'-\ln\pi - \frac{1}{2}': '-ln(π) - 1/2',                               # Omega_c_star
+    r'-\frac{1}{5}(5\pi + 4)': '-(1/5)(5π + 4)',                            # Xi*
+    r'\frac{1}{5}(4\pi - 1)': '(1/5)(4π - 1)',                              # Xi*
 }
 
+# Correction patterns, compiled once
+_LEFT_FRAC_RE = re.compile(r'^([+-])?\\frac\{(\d+)\}\{(\d+)\}\\left\(([^)]+)\\right\)$')
+_FRAC_RE = re.compile(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}$')
+_FRAC_EPI_RE = re.compile(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}e\^\{-\\pi\}$')
+_FRAC_INT_RE = re.compile(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}\s*([+-])\s*(\d+)$')
+_FRAC_FRAC_RE = re.compile(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}\s*([+-])\s*\\frac\{([^}]+)\}\{([^}]+)\}$')
+_PI_FRAC_RE = re.compile(r'^([+-])?\\pi\s*([+-])\s*\\frac\{([^}]+)\}\{([^}]+)\}$')
+_PI_INT_RE = re.compile(r'^([+-])?\\pi\s*([+-])\s*(\d+)$')
+
+
+@lru_cache(maxsize=None)
 def latex_to_display(latex):
     """Convert simple LaTeX correction to Unicode display format.
 
-    Returns None for complex formulas (with \\left, \\right).
+    Returns None for complex formulas (with \\left, \\right). Results are
+    cached per LaTeX string.
     """
     if not latex:
         return None
 
     s = latex.strip()
 
-    # Handle specific complex patterns before rejecting all \left/\right
-    # Handle -(6/5)(π - e^{-π}) pattern (Omega)
-    if s == r'-\frac{6}{5}\left(\pi - e^{-\pi}\right)':
-        return '-(6/5)(π - e⁻ᵖⁱ)'
+    # Plain numbers: -4, +1, 2 (no pattern matching needed)
+    sign = s[:1] if s[:1] in ('+', '-') else ''
+    if s[len(sign):].isdecimal():
+        return s if sign else '+' + s
 
-    # Handle \frac{1}{5}\left(\pi - 2 + 4e^{-\pi}\right) pattern (Delta)
-    if s == r'\frac{1}{5}\left(\pi - 2 + 4e^{-\pi}\right)':
-        return '(1/5)(π - 2 + 4e⁻ᵖⁱ)'
+    # Every other supported form is LaTeX markup
+    if '\\' not in s:
+        return None
 
-    # Handle \frac{1}{5}\left(\pi - 7 - e^{-\pi}\right) pattern (Sigma_star_plus)
-    if s == r'\frac{1}{5}\left(\pi - 7 - e^{-\pi}\right)':
-        return '(1/5)(π - 7 - e⁻ᵖⁱ)'
+    # One-off forms are a single lookup
+    display = _EXACT_DISPLAY.get(s)
+    if display:
+        return display
 
     # Handle similar patterns for other Sigma* particles
     # \frac{1}{5}\left(a\pi + b + ce^{-\pi}\right)
-    m = re.match(r'^([+-])?\\frac\{(\d+)\}\{(\d+)\}\\left\(([^)]+)\\right\)$', s)
+    m = _LEFT_FRAC_RE.match(s)
     if m:
         sign = m.group(1) or ''
         num = m.group(2)
@@ -271,26 +320,8 @@ def latex_to_display(latex):
     if '\\left' in latex or '\\right' in latex:
         return None
 
-    # Handle -π - 1/π pattern (Xi0)
-    if s == r'-\pi - \frac{1}{\pi}':
-        return '-π - 1/π'
-
-    # Handle -\ln\pi - \frac{1}{2} pattern (Omega_c_star)
-    if s == r'-\ln\pi - \frac{1}{2}':
-        return '-ln(π) - 1/2'
-
-    # Handle Ξ* patterns: -\frac{1}{5}(5\pi + 4) and \frac{1}{5}(4\pi - 1)
-    if s == r'-\frac{1}{5}(5\pi + 4)':
-        return '-(1/5)(5π + 4)'
-    if s == r'\frac{1}{5}(4\pi - 1)':
-        return '(1/5)(4π - 1)'
-
-    # Plain numbers: -4, +1, -2
-    if re.match(r'^[+-]?\d+$', s):
-        return s if s.startswith(('+', '-')) else '+' + s
-
     # \frac{a}{b} patterns
-    m = re.match(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}$', s)
+    m = _FRAC_RE.match(s)
     if m:
         sign = m.group(1) or '+'
         num = m.group(2)
@@ -302,7 +333,7 @@ def latex_to_display(latex):
         return f"{sign}{num}/{denom}"
 
     # \frac{4}{5}e^{-\pi} pattern (proton)
-    m = re.match(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}e\^\{-\\pi\}$', s)
+    m = _FRAC_EPI_RE.match(s)
     if m:
         sign = m.group(1) or '+'
         num = m.group(2)
@@ -311,7 +342,7 @@ def latex_to_display(latex):
 
     # Compound patterns for charm baryons:
     # \frac{3\pi}{5} - 4 (Sigma_c_plus)
-    m = re.match(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}\s*([+-])\s*(\d+)$', s)
+    m = _FRAC_INT_RE.match(s)
     if m:
         sign1 = m.group(1) or ''
         num = m.group(2).replace('\\pi', 'π')
@@ -321,7 +352,7 @@ def latex_to_display(latex):
         return f"{sign1}{num}/{denom} {sign2} {val}"
 
     # -\frac{\pi}{5} + \frac{3}{5} (Sigma_c_pp)
-    m = re.match(r'^([+-])?\\frac\{([^}]+)\}\{([^}]+)\}\s*([+-])\s*\\frac\{([^}]+)\}\{([^}]+)\}$', s)
+    m = _FRAC_FRAC_RE.match(s)
     if m:
         sign1 = m.group(1) or ''
         num1 = m.group(2).replace('\\pi', 'π')
@@ -332,7 +363,7 @@ def latex_to_display(latex):
         return f"{sign1}{num1}/{denom1} {sign2} {num2}/{denom2}"
 
     # \pi - \frac{18}{5} (Sigma_c_zero)
-    m = re.match(r'^([+-])?\\pi\s*([+-])\s*\\frac\{([^}]+)\}\{([^}]+)\}$', s)
+    m = _PI_FRAC_RE.match(s)
     if m:
         sign1 = m.group(1) or ''
         sign2 = m.group(2)
@@ -341,7 +372,7 @@ def latex_to_display(latex):
         return f"{sign1}π {sign2} {num}/{denom}"
 
     # Simple \pi +/- number patterns
-    m = re.match(r'^([+-])?\\pi\s*([+-])\s*(\d+)$', s)
+    m = _PI_INT_RE.match(s)
     if m:
         sign1 = m.group(1) or ''
         sign2 = m.group(2)
@@ -351,35 +382,36 @@ def latex_to_display(latex):
     return None
 
 
+# Display strings for every particle's correction, parsed once
+CORRECTION_DISPLAY = {key: latex_to_display(p.correction_latex) for key, p in ALL_PARTICLES.items()}
+
+
 def get_correction_display(key):
     """Get correction display string from master data."""
-    if key not in ALL_PARTICLES:
-        return None
-    p = ALL_PARTICLES[key]
-    return latex_to_display(p.correction_latex)
+    return CORRECTION_DISPLAY.get(key)
 
 
 def get_correction_value(key):
     """Get correction numerical value from master data (in m_e)."""
-    if key not in ALL_PARTICLES:
-        return 0.0
-    return ALL_PARTICLES[key].correction()
+    return CORRECTION.get(key, 0.0)
 
 
-def get_residual_me(p):
+def get_residual_me(key):
     """Get residual (exp - poly) in m_e units."""
-    return p.mass_exp / M_E - p.mass_base()
+    return RESIDUAL_ME[key]
 
 
-def compute_mass_data(p, unc_key):
+def compute_mass_data(key):
     """Pre-calculate mass, error, and sigma for a particle."""
-    calc_mev = p.mass_mev()
-    base_mev = p.mass_base() * M_E
-    corr_mev = p.correction() * M_E if p.correction_func else 0
+    p = ALL_PARTICLES[key]
+    mass_base = MASS_BASE[key]
+    calc_mev = (mass_base + CORRECTION[key]) * M_E
+    base_mev = mass_base * M_E
+    corr_mev = CORRECTION[key] * M_E if p.correction_func else 0
     exp_mev = p.mass_exp
     error_mev = calc_mev - exp_mev
     error_kev = error_mev * 1000
-    unc = UNCERTAINTIES.get(unc_key, 1.0)
+    unc = UNCERTAINTIES.get(key, 1.0)
     sigma = abs(error_mev) / unc if unc > 0 else 0
     return {
         'calc_mev': calc_mev,
@@ -391,1179 +423,375 @@ def compute_mass_data(p, unc_key):
     }
 
 
+# Mass, error and sigma for the whole catalog, worked out once at import
+MASS_DATA = {key: compute_mass_data(key) for key in ALL_PARTICLES}
+
+
+@lru_cache(maxsize=None)
 def format_coeff(c, power_str, is_first=False):
-    """Format a coefficient, omitting 1 coefficients, with spaces around operators."""
+    """Format a coefficient, omitting 1 coefficients, with spaces around operators.
+
+    Coefficients are small ints, so only a few dozen distinct terms occur.
+    """
     if c == 0:
         return None
-    c_int = int(c)
     if is_first:
-        if c_int == 1:
+        if c == 1:
             return power_str
-        elif c_int == -1:
+        elif c == -1:
             return f"-{power_str}"
         else:
-            return f"{c_int}{power_str}"
+            return f"{c}{power_str}"
     else:
-        if c_int == 1:
+        if c == 1:
             return f" + {power_str}"
-        elif c_int == -1:
+        elif c == -1:
             return f" - {power_str}"
-        elif c_int > 0:
-            return f" + {c_int}{power_str}"
+        elif c > 0:
+            return f" + {c}{power_str}"
         else:
-            return f" - {abs(c_int)}{power_str}"
+            return f" - {-c}{power_str}"
+
+
+# Powers of π matching the (c6, c5, c4, c3, c2) coefficient order
+_POWER_STRS = ("π⁶", "π⁵", "π⁴", "π³", "π²")
+
+
+@lru_cache(maxsize=None)
+def format_polynomial(c6=0, c5=0, c4=0, c3=0, c2=0):
+    """Format a polynomial from its coefficients.
+
+    Cached, since sibling particles and their diffs repeat the same terms.
+    """
+    parts = []
+    for c, power_str in zip((c6, c5, c4, c3, c2), _POWER_STRS):
+        if c:
+            parts.append(format_coeff(c, power_str, is_first=not parts))
+    return "".join(parts) if parts else "0"
+
 
 def format_full_formula(p):
     """Format complete polynomial formula."""
-    parts = []
-    if p.c6:
-        parts.append(format_coeff(p.c6, "π⁶", is_first=len(parts)==0))
-    if p.c5:
-        parts.append(format_coeff(p.c5, "π⁵", is_first=len(parts)==0))
-    if p.c4:
-        parts.append(format_coeff(p.c4, "π⁴", is_first=len(parts)==0))
-    if p.c3:
-        parts.append(format_coeff(p.c3, "π³", is_first=len(parts)==0))
-    if p.c2:
-        parts.append(format_coeff(p.c2, "π²", is_first=len(parts)==0))
-    return "".join(p for p in parts if p) if parts else "0"
+    return format_polynomial(p.c6, p.c5, p.c4, p.c3, p.c2)
+
+
+# Full formula for every particle, formatted once
+FORMULA = {key: format_full_formula(p) for key, p in ALL_PARTICLES.items()}
 
 
 def format_remainder(p, base_c5):
     """Format the remainder formula (what's added beyond the base c5)."""
-    parts = []
-    # c6 term (for double charm)
-    if hasattr(p, 'c6') and p.c6:
-        parts.append(format_coeff(p.c6, "π⁶", is_first=len(parts)==0))
-    # Extra c5 beyond base
-    extra_c5 = p.c5 - base_c5
-    if extra_c5:
-        parts.append(format_coeff(extra_c5, "π⁵", is_first=len(parts)==0))
-    if p.c4:
-        parts.append(format_coeff(p.c4, "π⁴", is_first=len(parts)==0))
-    if p.c3:
-        parts.append(format_coeff(p.c3, "π³", is_first=len(parts)==0))
-    if p.c2:
-        parts.append(format_coeff(p.c2, "π²", is_first=len(parts)==0))
-    return "".join(p for p in parts if p) if parts else ""
+    # Extra c5 beyond base; c6 is kept whole (for double charm)
+    coeffs = (p.c6, p.c5 - base_c5, p.c4, p.c3, p.c2)
+    return format_polynomial(*coeffs) if any(coeffs) else ""
 
 
 def format_diff(p, parent_c6=0, parent_c5=0, parent_c4=0, parent_c3=0, parent_c2=0):
     """Format what this particle adds beyond its parent node."""
-    parts = []
-    # c6 term (for double charm)
-    if hasattr(p, 'c6') and p.c6:
-        diff_c6 = p.c6 - parent_c6
-        if diff_c6:
-            parts.append(format_coeff(diff_c6, "π⁶", is_first=len(parts)==0))
-    # Differences from parent
-    diff_c5 = p.c5 - parent_c5
-    if diff_c5:
-        parts.append(format_coeff(diff_c5, "π⁵", is_first=len(parts)==0))
-    diff_c4 = p.c4 - parent_c4
-    if diff_c4:
-        parts.append(format_coeff(diff_c4, "π⁴", is_first=len(parts)==0))
-    diff_c3 = p.c3 - parent_c3
-    if diff_c3:
-        parts.append(format_coeff(diff_c3, "π³", is_first=len(parts)==0))
-    diff_c2 = p.c2 - parent_c2
-    if diff_c2:
-        parts.append(format_coeff(diff_c2, "π²", is_first=len(parts)==0))
-    return "".join(p for p in parts if p) if parts else ""
-
-
-def format_correction(corr, has_poly=True):
-    """Format correction with proper spacing. Disabled - corrections not shown in tree nodes."""
-    return ""
+    # Differences from parent; the c6 term (for double charm) only counts
+    # when the particle has one
+    diffs = (
+        p.c6 - parent_c6 if p.c6 else 0,
+        p.c5 - parent_c5,
+        p.c4 - parent_c4,
+        p.c3 - parent_c3,
+        p.c2 - parent_c2,
+    )
+    return format_polynomial(*diffs) if any(diffs) else ""
+
+
+# Family tree entries. A virtual node groups the particles that share its
+# coefficients; a particle gives its catalog key, the charge to show and the
+# sublabel to use when it adds nothing beyond its parent.
+VSpec = namedtuple('VSpec', 'node_id coeffs description children')
+PSpec = namedtuple('PSpec', 'key charge base', defaults=('',))
+
+LIGHT_TREE = VSpec('root6', {'c5': 6}, 'Light baryon base (S=0)', [
+    PSpec('proton', '+1'),
+    PSpec('neutron', '0'),
+    VSpec('vD6pi4', {'c5': 6, 'c4': 6}, 'Delta decuplet base (6π⁴)', [
+        PSpec('Delta', '++,+,0,-'),
+    ]),
+    VSpec('v7', {'c5': 7}, 'Strangeness -1 level', [
+        PSpec('Lambda', '0'),
+        VSpec('vS6pi3', {'c5': 7, 'c3': 6}, 'Sigma octet base (6π³)', [
+            PSpec('Sigma_plus', '+1'),
+            PSpec('Sigma_zero', '0'),
+            PSpec('Sigma_minus', '-1'),
+        ]),
+        VSpec('vSs6pi4', {'c5': 7, 'c4': 6}, 'Sigma* decuplet base (6π⁴)', [
+            PSpec('Sigma_star_plus', '+1'),
+            PSpec('Sigma_star_zero', '0'),
+            PSpec('Sigma_star_minus', '-1'),
+        ]),
+        VSpec('v8', {'c5': 8}, 'Strangeness -2 level (Xi)', [
+            VSpec('vXpi4pi3', {'c5': 8, 'c4': 1, 'c3': 1}, 'Xi octet base', [
+                PSpec('Xi_zero', '0'),
+                PSpec('Xi_minus', '-1'),
+            ]),
+            VSpec('vXs6pi4', {'c5': 8, 'c4': 6, 'c3': -1}, 'Xi* decuplet base', [
+                PSpec('Xi_star_zero', '0'),
+                PSpec('Xi_star_minus', '-1'),
+            ]),
+            VSpec('v9', {'c5': 9}, 'Strangeness -3 level (Omega)', [
+                PSpec('Omega', '-1'),
+            ]),
+        ]),
+    ]),
+])
+
+CHARM_TREE = VSpec('root14', {'c5': 14}, 'Charm baryon base (C=1)', [
+    PSpec('Lambda_c', '+1', '(base)'),
+    VSpec('vSc', {'c5': 14, 'c4': 5, 'c3': 1}, 'Sigma_c base', [
+        PSpec('Sigma_c_pp', '2'),
+        PSpec('Sigma_c_plus', '1'),
+        PSpec('Sigma_c_zero', '0'),
+    ]),
+    VSpec('vScs', {'c5': 14, 'c4': 6, 'c3': 2}, 'Sigma_c* base', [
+        PSpec('Sigma_c_star_pp', '2'),
+        PSpec('Sigma_c_star_plus', '1'),
+        PSpec('Sigma_c_star_zero', '0'),
+    ]),
+    VSpec('v15', {'c5': 15}, 'Charm + strange', [
+        VSpec('vXc', {'c5': 15, 'c4': 2, 'c3': 1}, 'Xi_c base', [
+            PSpec('Xi_c_plus', '+1'),
+            PSpec('Xi_c_zero', '0'),
+        ]),
+        VSpec('vXcs', {'c5': 15, 'c4': 6}, 'Xi_c* base', [
+            PSpec('Xi_c_star_plus', '1'),
+            PSpec('Xi_c_star_zero', '0'),
+        ]),
+        VSpec('v16', {'c5': 16}, 'Charm + double strange', [
+            PSpec('Omega_c', '0'),
+            PSpec('Omega_c_star', '0'),
+            VSpec('v7pi6', {'c6': 7}, 'Double charm level (C=2)', [
+                PSpec('Xi_cc_pp', '++'),
+            ]),
+        ]),
+    ]),
+])
+
+BOTTOM_TREE = VSpec('root36', {'c5': 36}, 'Bottom baryon base (B=-1)', [
+    PSpec('Lambda_b', '0', '(base)'),
+    VSpec('vSb3pi4', {'c5': 36, 'c4': 3, 'c3': 2}, 'Sigma_b+ family base', [
+        PSpec('Sigma_b_plus', '+1', '(base)'),
+        PSpec('Sigma_b_star_plus', '+1'),
+    ]),
+    VSpec('vSb4pi4', {'c5': 36, 'c4': 4}, 'Sigma_b- family base', [
+        PSpec('Sigma_b_minus', '-1'),
+        PSpec('Sigma_b_star_minus', '-1'),
+    ]),
+    VSpec('v37', {'c5': 37}, 'Bottom + strange', [
+        PSpec('Xi_b_zero', '0'),
+        PSpec('Xi_b_minus', '-1'),
+        VSpec('v38', {'c5': 38}, 'Bottom + double strange', [
+            PSpec('Omega_b', '-1'),
+        ]),
+    ]),
+])
+
+
+# Nodes are built as rows with these fields, in the order written to the
+# page. position stays last: pack_nodes sends it apart from the node data
+NODE_FIELDS = (
+    'id', 'label', 'sublabel', 'type', 'formula', 'correction', 'description',
+    'mass_me', 'actual_mev', 'residual_me', 'charge', 'spin', 'strangeness', 'quarks',
+    'calc_mev', 'base_mev', 'corr_mev', 'error_kev', 'sigma', 'uncertainty', 'position'
+)
+# Node types, stored in rows by index and named once per tab
+NODE_TYPES = ('particle', 'spin32', 'virtual', 'virtual-coeff')
+_PARTICLE, _SPIN32, _VIRTUAL, _VIRTUAL_COEFF = range(len(NODE_TYPES))
+# Row indices the generator reads back after building
+_ID, _TYPE, _ACTUAL_MEV, _POSITION = (
+    NODE_FIELDS.index(k) for k in ('id', 'type', 'actual_mev', 'position')
+)
+# Virtual nodes have none of the particle fields after 'description'
+_NO_PARTICLE_FIELDS = [None] * (len(NODE_FIELDS) - NODE_FIELDS.index('description') - 1)
 
 
-def generate_light_baryon_data():
-    """Generate nodes and edges for light baryons."""
-    nodes = []
-    edges = []
-
-    # === ROOT: 6π⁵ (virtual) ===
-    lbl, sublbl = get_cycle_node('root6')
-    nodes.append({
-        'id': 'root6',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '6π⁵',
-        'description': 'Light baryon base (S=0)'
-    })
-
-    # === PROTON (6π⁵) - parent: root6 (6π⁵) ===
-    p = ALL_PARTICLES['proton']
-    corr_p = get_correction_display('proton')
-    poly_p = format_diff(p, parent_c5=6)
-    diff_p = poly_p + format_correction(corr_p, has_poly=bool(poly_p))
-    nodes.append({
-        'id': p.node_id,
-        'label': 'p',
-        'sublabel': diff_p if diff_p else '',
-        'type': 'particle',
-        'formula': format_full_formula(p),
-        'correction': corr_p,
-        'mass_me': p.mass_base(),
-        'actual_mev': p.mass_exp,
-        'residual_me': get_residual_me(p),
-        'charge': '+1',
-        'spin': '1/2',
-        'strangeness': 0,
-        'quarks': p.quarks
-    })
-    edges.append({'source': 'root6', 'target': p.node_id})
-
-    # === NEUTRON (6π⁵ + 8/π) - parent: root6 (6π⁵) ===
-    n = ALL_PARTICLES['neutron']
-    corr_n = get_correction_display('neutron')
-    poly_n = format_diff(n, parent_c5=6)
-    diff_n = poly_n + format_correction(corr_n, has_poly=bool(poly_n))
-    nodes.append({
-        'id': n.node_id,
-        'label': 'n',
-        'sublabel': diff_n if diff_n else '',
-        'type': 'particle',
-        'formula': format_full_formula(n),
-        'correction': corr_n,
-        'mass_me': n.mass_base(),
-        'actual_mev': n.mass_exp,
-        'residual_me': get_residual_me(n),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': 0,
-        'quarks': n.quarks
-    })
-    edges.append({'source': 'root6', 'target': n.node_id})
-
-    # === Delta decuplet: share 6π⁴ ===
-    lbl, sublbl = get_cycle_node('vD6pi4')
-    nodes.append({
-        'id': 'vD6pi4',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '6π⁵ + 6π⁴',
-        'description': 'Delta decuplet base (6π⁴)'
-    })
-    edges.append({'source': 'root6', 'target': 'vD6pi4'})
-
-    # DELTA (6π⁵ + 6π⁴ - π²) - parent: vD6pi4 (c5=6, c4=6)
-    delta = ALL_PARTICLES['Delta']
-    corr_d = get_correction_display('Delta')
-    diff_d = format_diff(delta, parent_c5=6, parent_c4=6)
-    nodes.append({
-        'id': delta.node_id,
-        'label': 'Δ',
-        'sublabel': diff_d,
-        'type': 'spin32',
-        'formula': format_full_formula(delta),
-        'correction': corr_d,
-        'mass_me': delta.mass_base(),
-        'actual_mev': delta.mass_exp,
-        'residual_me': get_residual_me(delta),
-        'charge': '++,+,0,-',
-        'spin': '3/2',
-        'strangeness': 0,
-        'quarks': delta.quarks
-    })
-    edges.append({'source': 'vD6pi4', 'target': delta.node_id})
-
-    # === 7π⁵ LEVEL (S=-1) ===
-    lbl, sublbl = get_cycle_node('v7')
-    nodes.append({
-        'id': 'v7',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '7π⁵',
-        'description': 'Strangeness -1 level'
-    })
-    edges.append({'source': 'root6', 'target': 'v7'})
-
-    # Lambda: 7π⁵ + π³ + π² - parent: v7 (7π⁵)
-    lam = ALL_PARTICLES['Lambda']
-    corr_lam = get_correction_display('Lambda')
-    poly_lam = format_diff(lam, parent_c5=7)
-    diff_lam = poly_lam + format_correction(corr_lam, has_poly=bool(poly_lam))
-    nodes.append({
-        'id': lam.node_id,
-        'label': 'Λ',
-        'sublabel': diff_lam,
-        'type': 'particle',
-        'formula': format_full_formula(lam),
-        'correction': corr_lam,
-        'mass_me': lam.mass_base(),
-        'actual_mev': lam.mass_exp,
-        'residual_me': get_residual_me(lam),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': lam.quarks
-    })
-    edges.append({'source': 'v7', 'target': lam.node_id})
-
-    # === Sigma octet: share 6π³ ===
-    lbl, sublbl = get_cycle_node('vS6pi3')
-    nodes.append({
-        'id': 'vS6pi3',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '7π⁵ + 6π³',
-        'description': 'Sigma octet base (6π³)'
-    })
-    edges.append({'source': 'v7', 'target': 'vS6pi3'})
-
-    # Σ+: 7π⁵ + 6π³ (c2=0) - parent: vS6pi3 (c5=7, c3=6)
-    sp = ALL_PARTICLES['Sigma_plus']
-    corr_sp = get_correction_display('Sigma_plus')
-    poly_sp = format_diff(sp, parent_c5=7, parent_c3=6)
-    diff_sp = poly_sp + format_correction(corr_sp, has_poly=bool(poly_sp))
-    nodes.append({
-        'id': sp.node_id,
-        'label': 'Σ⁺',
-        'sublabel': diff_sp,
-        'type': 'particle',
-        'formula': format_full_formula(sp),
-        'correction': corr_sp,
-        'mass_me': sp.mass_base(),
-        'actual_mev': sp.mass_exp,
-        'residual_me': get_residual_me(sp),
-        'charge': '+1',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': sp.quarks
-    })
-    edges.append({'source': 'vS6pi3', 'target': sp.node_id})
-
-    # Σ0: 7π⁵ + 6π³ + π² - parent: vS6pi3 (c5=7, c3=6)
-    s0 = ALL_PARTICLES['Sigma_zero']
-    corr_s0 = get_correction_display('Sigma_zero')
-    poly_s0 = format_diff(s0, parent_c5=7, parent_c3=6)
-    diff_s0 = poly_s0 + format_correction(corr_s0, has_poly=bool(poly_s0))
-    nodes.append({
-        'id': s0.node_id,
-        'label': 'Σ⁰',
-        'sublabel': diff_s0,
-        'type': 'particle',
-        'formula': format_full_formula(s0),
-        'correction': corr_s0,
-        'mass_me': s0.mass_base(),
-        'actual_mev': s0.mass_exp,
-        'residual_me': get_residual_me(s0),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': s0.quarks
-    })
-    edges.append({'source': 'vS6pi3', 'target': s0.node_id})
-
-    # Σ-: 7π⁵ + 6π³ + 2π² - parent: vS6pi3 (c5=7, c3=6)
-    sm = ALL_PARTICLES['Sigma_minus']
-    corr_sm = get_correction_display('Sigma_minus')
-    poly_sm = format_diff(sm, parent_c5=7, parent_c3=6)
-    diff_sm = poly_sm + format_correction(corr_sm, has_poly=bool(poly_sm))
-    nodes.append({
-        'id': sm.node_id,
-        'label': 'Σ⁻',
-        'sublabel': diff_sm,
-        'type': 'particle',
-        'formula': format_full_formula(sm),
-        'correction': corr_sm,
-        'mass_me': sm.mass_base(),
-        'actual_mev': sm.mass_exp,
-        'residual_me': get_residual_me(sm),
-        'charge': '-1',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': sm.quarks
-    })
-    edges.append({'source': 'vS6pi3', 'target': sm.node_id})
-
-    # === Sigma* decuplet: share 6π⁴ ===
-    lbl, sublbl = get_cycle_node('vSs6pi4')
-    nodes.append({
-        'id': 'vSs6pi4',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '7π⁵ + 6π⁴',
-        'description': 'Sigma* decuplet base (6π⁴)'
-    })
-    edges.append({'source': 'v7', 'target': 'vSs6pi4'})
-
-    # Σ*+: 7π⁵ + 6π⁴ - 2π² - parent: vSs6pi4 (c5=7, c4=6)
-    ssp = ALL_PARTICLES['Sigma_star_plus']
-    corr_ssp = get_correction_display('Sigma_star_plus')
-    poly_ssp = format_diff(ssp, parent_c5=7, parent_c4=6)
-    diff_ssp = poly_ssp + format_correction(corr_ssp, has_poly=bool(poly_ssp))
-    nodes.append({
-        'id': ssp.node_id,
-        'label': 'Σ*⁺',
-        'sublabel': diff_ssp,
-        'type': 'spin32',
-        'formula': format_full_formula(ssp),
-        'correction': corr_ssp,
-        'mass_me': ssp.mass_base(),
-        'actual_mev': ssp.mass_exp,
-        'residual_me': get_residual_me(ssp),
-        'charge': '+1',
-        'spin': '3/2',
-        'strangeness': -1,
-        'quarks': ssp.quarks
-    })
-    edges.append({'source': 'vSs6pi4', 'target': ssp.node_id})
-
-    # Σ*0: 7π⁵ + 6π⁴ - 2π² + 1 - parent: vSs6pi4 (c5=7, c4=6)
-    ss0 = ALL_PARTICLES['Sigma_star_zero']
-    corr_ss0 = get_correction_display('Sigma_star_zero')
-    poly_ss0 = format_diff(ss0, parent_c5=7, parent_c4=6)
-    diff_ss0 = poly_ss0 + format_correction(corr_ss0, has_poly=bool(poly_ss0))
-    nodes.append({
-        'id': ss0.node_id,
-        'label': 'Σ*⁰',
-        'sublabel': diff_ss0,
-        'type': 'spin32',
-        'formula': format_full_formula(ss0),
-        'correction': corr_ss0,
-        'mass_me': ss0.mass_base(),
-        'actual_mev': ss0.mass_exp,
-        'residual_me': get_residual_me(ss0),
-        'charge': '0',
-        'spin': '3/2',
-        'strangeness': -1,
-        'quarks': ss0.quarks
-    })
-    edges.append({'source': 'vSs6pi4', 'target': ss0.node_id})
-
-    # Σ*-: 7π⁵ + 6π⁴ - π² - parent: vSs6pi4 (c5=7, c4=6)
-    ssm = ALL_PARTICLES['Sigma_star_minus']
-    corr_ssm = get_correction_display('Sigma_star_minus')
-    poly_ssm = format_diff(ssm, parent_c5=7, parent_c4=6)
-    diff_ssm = poly_ssm + format_correction(corr_ssm, has_poly=bool(poly_ssm))
-    nodes.append({
-        'id': ssm.node_id,
-        'label': 'Σ*⁻',
-        'sublabel': diff_ssm,
-        'type': 'spin32',
-        'formula': format_full_formula(ssm),
-        'correction': corr_ssm,
-        'mass_me': ssm.mass_base(),
-        'actual_mev': ssm.mass_exp,
-        'residual_me': get_residual_me(ssm),
-        'charge': '-1',
-        'spin': '3/2',
-        'strangeness': -1,
-        'quarks': ssm.quarks
-    })
-    edges.append({'source': 'vSs6pi4', 'target': ssm.node_id})
-
-    # === 8π⁵ LEVEL (S=-2) ===
-    lbl, sublbl = get_cycle_node('v8')
-    nodes.append({
-        'id': 'v8',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '8π⁵',
-        'description': 'Strangeness -2 level (Xi)'
-    })
-    edges.append({'source': 'v7', 'target': 'v8'})
-
-    # === Xi octet: share π⁴ + π³ ===
-    lbl, sublbl = get_cycle_node('vXpi4pi3')
-    nodes.append({
-        'id': 'vXpi4pi3',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '8π⁵ + π⁴ + π³',
-        'description': 'Xi octet base'
-    })
-    edges.append({'source': 'v8', 'target': 'vXpi4pi3'})
-
-    # Ξ0: 8π⁵ + π⁴ + π³ - parent: vXpi4pi3 (c5=8, c4=1, c3=1)
-    x0 = ALL_PARTICLES['Xi_zero']
-    corr_x0 = get_correction_display('Xi_zero')
-    poly_x0 = format_diff(x0, parent_c5=8, parent_c4=1, parent_c3=1)
-    diff_x0 = poly_x0 + format_correction(corr_x0, has_poly=bool(poly_x0))
-    nodes.append({
-        'id': x0.node_id,
-        'label': 'Ξ⁰',
-        'sublabel': diff_x0,
-        'type': 'particle',
-        'formula': format_full_formula(x0),
-        'correction': corr_x0,
-        'mass_me': x0.mass_base(),
-        'actual_mev': x0.mass_exp,
-        'residual_me': get_residual_me(x0),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': -2,
-        'quarks': x0.quarks
-    })
-    edges.append({'source': 'vXpi4pi3', 'target': x0.node_id})
-
-    # Ξ-: 8π⁵ + π⁴ + π³ + π² (Tier 1) - parent: vXpi4pi3 (c5=8, c4=1, c3=1)
-    xm = ALL_PARTICLES['Xi_minus']
-    corr_xm = get_correction_display('Xi_minus')
-    poly_xm = format_diff(xm, parent_c5=8, parent_c4=1, parent_c3=1)
-    diff_xm = poly_xm + format_correction(corr_xm, has_poly=bool(poly_xm))
-    nodes.append({
-        'id': xm.node_id,
-        'label': 'Ξ⁻',
-        'sublabel': diff_xm,
-        'type': 'particle',
-        'formula': format_full_formula(xm),
-        'correction': corr_xm,
-        'mass_me': xm.mass_base(),
-        'actual_mev': xm.mass_exp,
-        'residual_me': get_residual_me(xm),
-        'charge': '-1',
-        'spin': '1/2',
-        'strangeness': -2,
-        'quarks': xm.quarks
-    })
-    edges.append({'source': 'vXpi4pi3', 'target': xm.node_id})
-
-    # === Xi* decuplet: share 6π⁴ - π³ ===
-    lbl, sublbl = get_cycle_node('vXs6pi4')
-    nodes.append({
-        'id': 'vXs6pi4',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '8π⁵ + 6π⁴ - π³',
-        'description': 'Xi* decuplet base'
-    })
-    edges.append({'source': 'v8', 'target': 'vXs6pi4'})
-
-    # Ξ*0: 8π⁵ + 6π⁴ - π³ - parent: vXs6pi4 (c5=8, c4=6, c3=-1)
-    xs0 = ALL_PARTICLES['Xi_star_zero']
-    corr_xs0 = get_correction_display('Xi_star_zero')
-    poly_xs0 = format_diff(xs0, parent_c5=8, parent_c4=6, parent_c3=-1)
-    diff_xs0 = poly_xs0 + format_correction(corr_xs0, has_poly=bool(poly_xs0))
-    nodes.append({
-        'id': xs0.node_id,
-        'label': 'Ξ*⁰',
-        'sublabel': diff_xs0,
-        'type': 'spin32',
-        'formula': format_full_formula(xs0),
-        'correction': corr_xs0,
-        'mass_me': xs0.mass_base(),
-        'actual_mev': xs0.mass_exp,
-        'residual_me': get_residual_me(xs0),
-        'charge': '0',
-        'spin': '3/2',
-        'strangeness': -2,
-        'quarks': xs0.quarks
-    })
-    edges.append({'source': 'vXs6pi4', 'target': xs0.node_id})
-
-    # Ξ*-: 8π⁵ + 6π⁴ - π³ - parent: vXs6pi4 (c5=8, c4=6, c3=-1)
-    xsm = ALL_PARTICLES['Xi_star_minus']
-    corr_xsm = get_correction_display('Xi_star_minus')
-    poly_xsm = format_diff(xsm, parent_c5=8, parent_c4=6, parent_c3=-1)
-    diff_xsm = poly_xsm + format_correction(corr_xsm, has_poly=bool(poly_xsm))
-    nodes.append({
-        'id': xsm.node_id,
-        'label': 'Ξ*⁻',
-        'sublabel': diff_xsm,
-        'type': 'spin32',
-        'formula': format_full_formula(xsm),
-        'correction': corr_xsm,
-        'mass_me': xsm.mass_base(),
-        'actual_mev': xsm.mass_exp,
-        'residual_me': get_residual_me(xsm),
-        'charge': '-1',
-        'spin': '3/2',
-        'strangeness': -2,
-        'quarks': xsm.quarks
-    })
-    edges.append({'source': 'vXs6pi4', 'target': xsm.node_id})
-
-    # === 9π⁵ LEVEL (S=-3) ===
-    lbl, sublbl = get_cycle_node('v9')
-    nodes.append({
-        'id': 'v9',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '9π⁵',
-        'description': 'Strangeness -3 level (Omega)'
-    })
-    edges.append({'source': 'v8', 'target': 'v9'})
-
-    # Ω-: 9π⁵ + 6π⁴ - 2π³ - parent: v9 (c5=9)
-    om = ALL_PARTICLES['Omega']
-    corr_om = get_correction_display('Omega')
-    poly_om = format_diff(om, parent_c5=9)
-    diff_om = poly_om + format_correction(corr_om, has_poly=bool(poly_om))
-    nodes.append({
-        'id': om.node_id,
-        'label': 'Ω⁻',
-        'sublabel': diff_om,
-        'type': 'spin32',
-        'formula': format_full_formula(om),
-        'correction': corr_om,
-        'mass_me': om.mass_base(),
-        'actual_mev': om.mass_exp,
-        'residual_me': get_residual_me(om),
-        'charge': '-1',
-        'spin': '3/2',
-        'strangeness': -3,
-        'quarks': om.quarks
-    })
-    edges.append({'source': 'v9', 'target': om.node_id})
+def _count_nodes(spec):
+    """Number of nodes a virtual node spec expands to, itself included."""
+    return 1 + sum(_count_nodes(c) if isinstance(c, VSpec) else 1 for c in spec.children)
+
+
+def _emit_particle(spec, nodes, edges, i, parent_id, parent_args):
+    """Store the node and incoming edge for a particle spec at index i.
+
+    parent_args are the parent's coefficients as format_diff keywords.
+    """
+    key, charge, base = spec
+    p = ALL_PARTICLES[key]
+    node_id, symbol, spin = p.node_id, p.symbol, p.spin
+    corr = get_correction_display(key)
+    # Corrections are not shown in tree nodes (only in the info panel), so
+    # the sublabel is just the polynomial difference
+    sublabel = format_diff(p, **parent_args) or base
+    m = MASS_DATA[key]
+    nodes[i] = [
+        node_id,
+        # Cytoscape shows the label as is, so the sublabel goes on a second line
+        f'{symbol}\n{sublabel}' if sublabel else symbol,
+        sublabel,
+        _SPIN32 if spin == '3/2' else _PARTICLE,
+        FORMULA[key],
+        corr,
+        None,
+        MASS_BASE[key], p.mass_exp, get_residual_me(key),
+        charge, spin, p.strangeness, p.quarks,
+        m['calc_mev'], m['base_mev'], m['corr_mev'], m['error_kev'], m['sigma'], m['uncertainty'],
+        None,  # position, set by _layout
+    ]
+    edges[i - 1] = {'data': {'id': f'e{i - 1}', 'source': parent_id, 'target': node_id}}
+
+
+def _build(spec, nodes, edges, i=0, parent_id=None):
+    """Fill in a virtual node and everything below it, depth first.
+
+    Nodes are rows in NODE_FIELDS order, stored from index i on; every
+    node but the root has exactly one incoming edge, so node i's edge goes
+    at index i - 1. Returns the index after the last node written.
+    """
+    node_id, coeffs, description, children = spec
+    lbl, sublbl = get_cycle_node(node_id)
+    # Strangeness levels (roots, no sublabel) are drawn as ellipses and
+    # coefficient bases (sublabel like "Σ base") as hexagons
+    is_level = node_id.startswith('root') or sublbl == ''
+    # Most levels are labelled with their own polynomial; the page falls
+    # back to the label when formula is left out
+    formula = format_polynomial(**coeffs)
+    nodes[i] = [
+        node_id, lbl, sublbl, _VIRTUAL if is_level else _VIRTUAL_COEFF,
+        None if formula == lbl else formula, None, description,
+    ] + _NO_PARTICLE_FIELDS
+    if parent_id:
+        edges[i - 1] = {'data': {'id': f'e{i - 1}', 'source': parent_id, 'target': node_id}}
+    i += 1
+
+    # Keyword names are built once here rather than once per child particle
+    parent_args = {'parent_' + c: v for c, v in coeffs.items()}
+    for child in children:
+        if isinstance(child, VSpec):
+            i = _build(child, nodes, edges, i, node_id)
+        else:
+            _emit_particle(child, nodes, edges, i, node_id, parent_args)
+            i += 1
+    return i
+
+
+# Layered layout spacing in px, sized to the node shapes in the page styles
+LAYER_SPACING = 180
+SIBLING_SPACING = 190
+
+
+# Sibling groups from left to right: octet, virtual nodes, decuplet
+_LAYOUT_GROUP = {_PARTICLE: 0, _VIRTUAL: 1, _VIRTUAL_COEFF: 1, _SPIN32: 2}
+
 
+def _layout(nodes, edges):
+    """Assign each node a fixed top-down tree position.
+
+    Rows follow depth from the root and leaves are spread left to right.
+    Siblings are grouped octet, virtual, decuplet from left to right, and
+    ordered lightest to heaviest within a group (a virtual node by its
+    lightest particle); each parent is centred over its children. The page
+    then uses Cytoscape's preset layout as is.
+    """
+    by_id = {n[_ID]: n for n in nodes}
+    children = {n[_ID]: [] for n in nodes}
+    for e in edges:
+        children[e['data']['source']].append(by_id[e['data']['target']])
+    next_x = 0
+
+    def lightest(node):
+        kids = children[node[_ID]]
+        if kids:
+            return min(map(lightest, kids))
+        # A virtual node with nothing under it has no mass; put it last
+        mev = node[_ACTUAL_MEV]
+        return math.inf if mev is None else mev
+
+    def sort_key(node):
+        return _LAYOUT_GROUP[node[_TYPE]], lightest(node)
+
+    def place(node, depth):
+        nonlocal next_x
+        kids = sorted(children[node[_ID]], key=sort_key)
+        if kids:
+            xs = [place(kid, depth + 1) for kid in kids]
+            x = (xs[0] + xs[-1]) / 2
+        else:
+            x = next_x
+            next_x += SIBLING_SPACING
+        node[_POSITION] = [x, depth * LAYER_SPACING]
+        return x
+
+    place(nodes[0], 0)
+
+
+def _build_tree(spec):
+    """Generate nodes and edges for a family tree spec."""
+    # Sizes are known from the spec, so fill preallocated lists in place
+    count = _count_nodes(spec)
+    nodes = [None] * count
+    edges = [None] * (count - 1)
+    _build(spec, nodes, edges)
+    _layout(nodes, edges)
     return nodes, edges
 
 
+def generate_light_baryon_data():
+    """Generate nodes and edges for light baryons."""
+    return _build_tree(LIGHT_TREE)
+
+
 def generate_charm_baryon_data():
     """Generate nodes and edges for charm baryons."""
-    nodes = []
-    edges = []
-
-    # === ROOT: 14π⁵ (virtual) ===
-    lbl, sublbl = get_cycle_node('root14')
-    nodes.append({
-        'id': 'root14',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '14π⁵',
-        'description': 'Charm baryon base (C=1)'
-    })
-
-    # === LAMBDA_C (14π⁵ + 2π⁴) - parent: root14 (c5=14) ===
-    lc = ALL_PARTICLES['Lambda_c']
-    corr_lc = get_correction_display('Lambda_c')
-    poly_lc = format_diff(lc, parent_c5=14)
-    diff_lc = poly_lc + format_correction(corr_lc, has_poly=bool(poly_lc))
-    nodes.append({
-        'id': lc.node_id,
-        'label': 'Λc⁺',
-        'sublabel': diff_lc if diff_lc else '(base)',
-        'type': 'particle',
-        'formula': format_full_formula(lc),
-        'correction': corr_lc,
-        'mass_me': lc.mass_base(),
-        'actual_mev': lc.mass_exp,
-        'residual_me': get_residual_me(lc),
-        'charge': '+1',
-        'spin': '1/2',
-        'strangeness': 0,
-        'quarks': lc.quarks
-    })
-    edges.append({'source': 'root14', 'target': lc.node_id})
-
-    # === Sigma_c: share 5π⁴ + π³ ===
-    lbl, sublbl = get_cycle_node('vSc')
-    nodes.append({
-        'id': 'vSc',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '14π⁵ + 5π⁴ + π³',
-        'description': 'Sigma_c base'
-    })
-    edges.append({'source': 'root14', 'target': 'vSc'})
-
-    # Sigma_c particles - parent: vSc (c5=14, c4=5, c3=1)
-    for key in ['Sigma_c_pp', 'Sigma_c_plus', 'Sigma_c_zero']:
-        s = ALL_PARTICLES[key]
-        corr = get_correction_display(key)
-        poly = format_diff(s, parent_c5=14, parent_c4=5, parent_c3=1)
-        diff = poly + format_correction(corr, has_poly=bool(poly))
-        nodes.append({
-            'id': s.node_id,
-            'label': s.symbol,
-            'sublabel': diff,
-            'type': 'particle',
-            'formula': format_full_formula(s),
-            'correction': corr,
-            'mass_me': s.mass_base(),
-            'actual_mev': s.mass_exp,
-            'residual_me': get_residual_me(s),
-            'charge': str(s.charge),
-            'spin': '1/2',
-            'strangeness': 0,
-            'quarks': s.quarks
-        })
-        edges.append({'source': 'vSc', 'target': s.node_id})
-
-    # === Sigma_c*: share 6π⁴ + 2π³ ===
-    lbl, sublbl = get_cycle_node('vScs')
-    nodes.append({
-        'id': 'vScs',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '14π⁵ + 6π⁴ + 2π³',
-        'description': 'Sigma_c* base'
-    })
-    edges.append({'source': 'root14', 'target': 'vScs'})
-
-    # Sigma_c* particles - parent: vScs (c5=14, c4=6, c3=2)
-    for key in ['Sigma_c_star_pp', 'Sigma_c_star_plus', 'Sigma_c_star_zero']:
-        s = ALL_PARTICLES[key]
-        corr = get_correction_display(key)
-        poly = format_diff(s, parent_c5=14, parent_c4=6, parent_c3=2)
-        diff = poly + format_correction(corr, has_poly=bool(poly))
-        nodes.append({
-            'id': s.node_id,
-            'label': s.symbol,
-            'sublabel': diff,
-            'type': 'spin32',
-            'formula': format_full_formula(s),
-            'correction': corr,
-            'mass_me': s.mass_base(),
-            'actual_mev': s.mass_exp,
-            'residual_me': get_residual_me(s),
-            'charge': str(s.charge),
-            'spin': '3/2',
-            'strangeness': 0,
-            'quarks': s.quarks
-        })
-        edges.append({'source': 'vScs', 'target': s.node_id})
-
-    # === 15π⁵ LEVEL (charm + strange) ===
-    lbl, sublbl = get_cycle_node('v15')
-    nodes.append({
-        'id': 'v15',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '15π⁵',
-        'description': 'Charm + strange'
-    })
-    edges.append({'source': 'root14', 'target': 'v15'})
-
-    # Xi_c: share 2π⁴ + π³
-    lbl, sublbl = get_cycle_node('vXc')
-    nodes.append({
-        'id': 'vXc',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '15π⁵ + 2π⁴ + π³',
-        'description': 'Xi_c base'
-    })
-    edges.append({'source': 'v15', 'target': 'vXc'})
-
-    # Ξc⁺ - parent: vXc (c5=15, c4=2, c3=1)
-    xcp = ALL_PARTICLES['Xi_c_plus']
-    corr_xcp = get_correction_display('Xi_c_plus')
-    poly_xcp = format_diff(xcp, parent_c5=15, parent_c4=2, parent_c3=1)
-    diff_xcp = poly_xcp + format_correction(corr_xcp, has_poly=bool(poly_xcp))
-    nodes.append({
-        'id': xcp.node_id,
-        'label': 'Ξc⁺',
-        'sublabel': diff_xcp,
-        'type': 'particle',
-        'formula': format_full_formula(xcp),
-        'correction': corr_xcp,
-        'mass_me': xcp.mass_base(),
-        'actual_mev': xcp.mass_exp,
-        'residual_me': get_residual_me(xcp),
-        'charge': '+1',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': xcp.quarks
-    })
-    edges.append({'source': 'vXc', 'target': xcp.node_id})
-
-    # Ξc⁰ - parent: vXc (c5=15, c4=2, c3=1)
-    xc0 = ALL_PARTICLES['Xi_c_zero']
-    corr_xc0 = get_correction_display('Xi_c_zero')
-    poly_xc0 = format_diff(xc0, parent_c5=15, parent_c4=2, parent_c3=1)
-    diff_xc0 = poly_xc0 + format_correction(corr_xc0, has_poly=bool(poly_xc0))
-    nodes.append({
-        'id': xc0.node_id,
-        'label': 'Ξc⁰',
-        'sublabel': diff_xc0,
-        'type': 'particle',
-        'formula': format_full_formula(xc0),
-        'correction': corr_xc0,
-        'mass_me': xc0.mass_base(),
-        'actual_mev': xc0.mass_exp,
-        'residual_me': get_residual_me(xc0),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': xc0.quarks
-    })
-    edges.append({'source': 'vXc', 'target': xc0.node_id})
-
-    # Xi_c*: share 6π⁴
-    lbl, sublbl = get_cycle_node('vXcs')
-    nodes.append({
-        'id': 'vXcs',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '15π⁵ + 6π⁴',
-        'description': 'Xi_c* base'
-    })
-    edges.append({'source': 'v15', 'target': 'vXcs'})
-
-    # Xi_c* particles - parent: vXcs (c5=15, c4=6)
-    for key in ['Xi_c_star_plus', 'Xi_c_star_zero']:
-        x = ALL_PARTICLES[key]
-        corr = get_correction_display(key)
-        poly = format_diff(x, parent_c5=15, parent_c4=6)
-        diff = poly + format_correction(corr, has_poly=bool(poly))
-        nodes.append({
-            'id': x.node_id,
-            'label': x.symbol,
-            'sublabel': diff,
-            'type': 'spin32',
-            'formula': format_full_formula(x),
-            'correction': corr,
-            'mass_me': x.mass_base(),
-            'actual_mev': x.mass_exp,
-            'residual_me': get_residual_me(x),
-            'charge': str(x.charge),
-            'spin': '3/2',
-            'strangeness': -1,
-            'quarks': x.quarks
-        })
-        edges.append({'source': 'vXcs', 'target': x.node_id})
-
-    # === 16π⁵ LEVEL (charm + 2 strange) ===
-    lbl, sublbl = get_cycle_node('v16')
-    nodes.append({
-        'id': 'v16',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '16π⁵',
-        'description': 'Charm + double strange'
-    })
-    edges.append({'source': 'v15', 'target': 'v16'})
-
-    # Omega_c - parent: v16 (c5=16)
-    oc = ALL_PARTICLES['Omega_c']
-    corr_oc = get_correction_display('Omega_c')
-    poly_oc = format_diff(oc, parent_c5=16)
-    diff_oc = poly_oc + format_correction(corr_oc, has_poly=bool(poly_oc))
-    nodes.append({
-        'id': oc.node_id,
-        'label': 'Ωc⁰',
-        'sublabel': diff_oc,
-        'type': 'particle',
-        'formula': format_full_formula(oc),
-        'correction': corr_oc,
-        'mass_me': oc.mass_base(),
-        'actual_mev': oc.mass_exp,
-        'residual_me': get_residual_me(oc),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': -2,
-        'quarks': oc.quarks
-    })
-    edges.append({'source': 'v16', 'target': oc.node_id})
-
-    # Omega_c* - parent: v16 (c5=16)
-    ocs = ALL_PARTICLES['Omega_c_star']
-    corr_ocs = get_correction_display('Omega_c_star')
-    poly_ocs = format_diff(ocs, parent_c5=16)
-    diff_ocs = poly_ocs + format_correction(corr_ocs, has_poly=bool(poly_ocs))
-    nodes.append({
-        'id': ocs.node_id,
-        'label': 'Ωc*⁰',
-        'sublabel': diff_ocs,
-        'type': 'spin32',
-        'formula': format_full_formula(ocs),
-        'correction': corr_ocs,
-        'mass_me': ocs.mass_base(),
-        'actual_mev': ocs.mass_exp,
-        'residual_me': get_residual_me(ocs),
-        'charge': '0',
-        'spin': '3/2',
-        'strangeness': -2,
-        'quarks': ocs.quarks
-    })
-    edges.append({'source': 'v16', 'target': ocs.node_id})
-
-    # === Double charm: 7π⁶ level (child of v16) ===
-    lbl, sublbl = get_cycle_node('v7pi6')
-    nodes.append({
-        'id': 'v7pi6',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '7π⁶',
-        'description': 'Double charm level (C=2)'
-    })
-    edges.append({'source': 'v16', 'target': 'v7pi6'})
-
-    # Xi_cc++: parent v7pi6 (c6=7)
-    xcc = ALL_PARTICLES['Xi_cc_pp']
-    corr_xcc = get_correction_display('Xi_cc_pp')
-    poly_xcc = format_diff(xcc, parent_c6=7)
-    diff_xcc = poly_xcc + format_correction(corr_xcc, has_poly=bool(poly_xcc))
-    nodes.append({
-        'id': xcc.node_id,
-        'label': 'Ξcc⁺⁺',
-        'sublabel': diff_xcc,
-        'type': 'particle',
-        'formula': format_full_formula(xcc),
-        'correction': corr_xcc,
-        'mass_me': xcc.mass_base(),
-        'actual_mev': xcc.mass_exp,
-        'residual_me': get_residual_me(xcc),
-        'charge': '++',
-        'spin': '1/2',
-        'strangeness': 0,
-        'quarks': xcc.quarks
-    })
-    edges.append({'source': 'v7pi6', 'target': xcc.node_id})
-
-    return nodes, edges
+    return _build_tree(CHARM_TREE)
 
 
 def generate_bottom_baryon_data():
     """Generate nodes and edges for bottom baryons."""
-    nodes = []
-    edges = []
-
-    # === ROOT: 36π⁵ (virtual) ===
-    lbl, sublbl = get_cycle_node('root36')
-    nodes.append({
-        'id': 'root36',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '36π⁵',
-        'description': 'Bottom baryon base (B=-1)'
-    })
-
-    # === LAMBDA_B (36π⁵ - 2π²) - parent: root36 (c5=36) ===
-    lb = ALL_PARTICLES['Lambda_b']
-    corr_lb = get_correction_display('Lambda_b')
-    poly_lb = format_diff(lb, parent_c5=36)
-    diff_lb = poly_lb + format_correction(corr_lb, has_poly=bool(poly_lb))
-    nodes.append({
-        'id': lb.node_id,
-        'label': 'Λb⁰',
-        'sublabel': diff_lb if diff_lb else '(base)',
-        'type': 'particle',
-        'formula': format_full_formula(lb),
-        'correction': corr_lb,
-        'mass_me': lb.mass_base(),
-        'actual_mev': lb.mass_exp,
-        'residual_me': get_residual_me(lb),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': 0,
-        'quarks': lb.quarks
-    })
-    edges.append({'source': 'root36', 'target': lb.node_id})
-
-    # === 3π⁴ + 2π³ base (Σb⁺ family) ===
-    lbl, sublbl = get_cycle_node('vSb3pi4')
-    nodes.append({
-        'id': 'vSb3pi4',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '36π⁵ + 3π⁴ + 2π³',
-        'description': 'Sigma_b+ family base'
-    })
-    edges.append({'source': 'root36', 'target': 'vSb3pi4'})
-
-    # Sigma_b+ - parent: vSb3pi4 (c5=36, c4=3, c3=2)
-    sbp = ALL_PARTICLES['Sigma_b_plus']
-    corr_sbp = get_correction_display('Sigma_b_plus')
-    poly_sbp = format_diff(sbp, parent_c5=36, parent_c4=3, parent_c3=2)
-    diff_sbp = poly_sbp + format_correction(corr_sbp, has_poly=bool(poly_sbp))
-    nodes.append({
-        'id': sbp.node_id,
-        'label': 'Σb⁺',
-        'sublabel': diff_sbp if diff_sbp else '(base)',
-        'type': 'particle',
-        'formula': format_full_formula(sbp),
-        'correction': corr_sbp,
-        'mass_me': sbp.mass_base(),
-        'actual_mev': sbp.mass_exp,
-        'residual_me': get_residual_me(sbp),
-        'charge': '+1',
-        'spin': '1/2',
-        'strangeness': 0,
-        'quarks': sbp.quarks
-    })
-    edges.append({'source': 'vSb3pi4', 'target': sbp.node_id})
-
-    # Σb*⁺ (spin-3/2) - parent: vSb3pi4 (c5=36, c4=3, c3=2)
-    sbsp = ALL_PARTICLES['Sigma_b_star_plus']
-    corr_sbsp = get_correction_display('Sigma_b_star_plus')
-    poly_sbsp = format_diff(sbsp, parent_c5=36, parent_c4=3, parent_c3=2)
-    diff_sbsp = poly_sbsp + format_correction(corr_sbsp, has_poly=bool(poly_sbsp))
-    nodes.append({
-        'id': sbsp.node_id,
-        'label': 'Σb*⁺',
-        'sublabel': diff_sbsp,
-        'type': 'spin32',
-        'formula': format_full_formula(sbsp),
-        'correction': corr_sbsp,
-        'mass_me': sbsp.mass_base(),
-        'actual_mev': sbsp.mass_exp,
-        'residual_me': get_residual_me(sbsp),
-        'charge': '+1',
-        'spin': '3/2',
-        'strangeness': 0,
-        'quarks': sbsp.quarks
-    })
-    edges.append({'source': 'vSb3pi4', 'target': sbsp.node_id})
-
-    # === 4π⁴ base (Σb⁻ family) ===
-    lbl, sublbl = get_cycle_node('vSb4pi4')
-    nodes.append({
-        'id': 'vSb4pi4',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '36π⁵ + 4π⁴',
-        'description': 'Sigma_b- family base'
-    })
-    edges.append({'source': 'root36', 'target': 'vSb4pi4'})
-
-    # Sigma_b- - parent: vSb4pi4 (c5=36, c4=4)
-    sbm = ALL_PARTICLES['Sigma_b_minus']
-    corr_sbm = get_correction_display('Sigma_b_minus')
-    poly_sbm = format_diff(sbm, parent_c5=36, parent_c4=4)
-    diff_sbm = poly_sbm + format_correction(corr_sbm, has_poly=bool(poly_sbm))
-    nodes.append({
-        'id': sbm.node_id,
-        'label': 'Σb⁻',
-        'sublabel': diff_sbm,
-        'type': 'particle',
-        'formula': format_full_formula(sbm),
-        'correction': corr_sbm,
-        'mass_me': sbm.mass_base(),
-        'actual_mev': sbm.mass_exp,
-        'residual_me': get_residual_me(sbm),
-        'charge': '-1',
-        'spin': '1/2',
-        'strangeness': 0,
-        'quarks': sbm.quarks
-    })
-    edges.append({'source': 'vSb4pi4', 'target': sbm.node_id})
-
-    # Σb*⁻ (spin-3/2) - parent: vSb4pi4 (c5=36, c4=4)
-    sbsm = ALL_PARTICLES['Sigma_b_star_minus']
-    corr_sbsm = get_correction_display('Sigma_b_star_minus')
-    poly_sbsm = format_diff(sbsm, parent_c5=36, parent_c4=4)
-    diff_sbsm = poly_sbsm + format_correction(corr_sbsm, has_poly=bool(poly_sbsm))
-    nodes.append({
-        'id': sbsm.node_id,
-        'label': 'Σb*⁻',
-        'sublabel': diff_sbsm,
-        'type': 'spin32',
-        'formula': format_full_formula(sbsm),
-        'correction': corr_sbsm,
-        'mass_me': sbsm.mass_base(),
-        'actual_mev': sbsm.mass_exp,
-        'residual_me': get_residual_me(sbsm),
-        'charge': '-1',
-        'spin': '3/2',
-        'strangeness': 0,
-        'quarks': sbsm.quarks
-    })
-    edges.append({'source': 'vSb4pi4', 'target': sbsm.node_id})
-
-    # === 37π⁵ LEVEL (bottom + strange) ===
-    lbl, sublbl = get_cycle_node('v37')
-    nodes.append({
-        'id': 'v37',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '37π⁵',
-        'description': 'Bottom + strange'
-    })
-    edges.append({'source': 'root36', 'target': 'v37'})
-
-    # Xi_b0 - parent: v37 (c5=37)
-    xb0 = ALL_PARTICLES['Xi_b_zero']
-    corr_xb0 = get_correction_display('Xi_b_zero')
-    poly_xb0 = format_diff(xb0, parent_c5=37)
-    diff_xb0 = poly_xb0 + format_correction(corr_xb0, has_poly=bool(poly_xb0))
-    nodes.append({
-        'id': xb0.node_id,
-        'label': 'Ξb⁰',
-        'sublabel': diff_xb0,
-        'type': 'particle',
-        'formula': format_full_formula(xb0),
-        'correction': corr_xb0,
-        'mass_me': xb0.mass_base(),
-        'actual_mev': xb0.mass_exp,
-        'residual_me': get_residual_me(xb0),
-        'charge': '0',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': xb0.quarks
-    })
-    edges.append({'source': 'v37', 'target': xb0.node_id})
-
-    # Xi_b- - parent: v37 (c5=37)
-    xbm = ALL_PARTICLES['Xi_b_minus']
-    corr_xbm = get_correction_display('Xi_b_minus')
-    poly_xbm = format_diff(xbm, parent_c5=37)
-    diff_xbm = poly_xbm + format_correction(corr_xbm, has_poly=bool(poly_xbm))
-    nodes.append({
-        'id': xbm.node_id,
-        'label': 'Ξb⁻',
-        'sublabel': diff_xbm,
-        'type': 'particle',
-        'formula': format_full_formula(xbm),
-        'correction': corr_xbm,
-        'mass_me': xbm.mass_base(),
-        'actual_mev': xbm.mass_exp,
-        'residual_me': get_residual_me(xbm),
-        'charge': '-1',
-        'spin': '1/2',
-        'strangeness': -1,
-        'quarks': xbm.quarks
-    })
-    edges.append({'source': 'v37', 'target': xbm.node_id})
-
-    # === 38π⁵ LEVEL (bottom + 2 strange) ===
-    lbl, sublbl = get_cycle_node('v38')
-    nodes.append({
-        'id': 'v38',
-        'label': lbl,
-        'sublabel': sublbl,
-        'type': 'virtual',
-        'formula': '38π⁵',
-        'description': 'Bottom + double strange'
-    })
-    edges.append({'source': 'v37', 'target': 'v38'})
-
-    # Omega_b - parent: v38 (c5=38)
-    ob = ALL_PARTICLES['Omega_b']
-    corr_ob = get_correction_display('Omega_b')
-    poly_ob = format_diff(ob, parent_c5=38)
-    diff_ob = poly_ob + format_correction(corr_ob, has_poly=bool(poly_ob))
-    nodes.append({
-        'id': ob.node_id,
-        'label': 'Ωb⁻',
-        'sublabel': diff_ob,
-        'type': 'particle',
-        'formula': format_full_formula(ob),
-        'correction': corr_ob,
-        'mass_me': ob.mass_base(),
-        'actual_mev': ob.mass_exp,
-        'residual_me': get_residual_me(ob),
-        'charge': '-1',
-        'spin': '1/2',
-        'strangeness': -2,
-        'quarks': ob.quarks
-    })
-    edges.append({'source': 'v38', 'target': ob.node_id})
-
-    return nodes, edges
+    return _build_tree(BOTTOM_TREE)
 
 
-def enrich_nodes_with_mass_data(nodes):
-    """Add pre-calculated mass data to particle nodes."""
-    for node in nodes:
-        if node.get('type') == 'virtual':
-            continue
-        node_id = node.get('id')
-        # Find particle by node_id using the reverse mapping
-        particle_key = NODE_ID_TO_KEY.get(node_id)
-        if particle_key and particle_key in ALL_PARTICLES:
-            p = ALL_PARTICLES[particle_key]
-            data = compute_mass_data(p, particle_key)
-            node['calc_mev'] = data['calc_mev']
-            node['base_mev'] = data['base_mev']
-            node['corr_mev'] = data['corr_mev']
-            node['error_kev'] = data['error_kev']
-            node['sigma'] = data['sigma']
-            node['uncertainty'] = data['uncertainty']
+def pack_nodes(nodes):
+    """Pair node rows with their schema and type names for the page.
 
+    Keys and type names are then written once per tab instead of once per
+    node. Positions go in a parallel list of [x, y] pairs, since Cytoscape
+    takes them beside the node data rather than in it.
+    """
+    return {
+        'schema': NODE_FIELDS[:_POSITION], 'types': NODE_TYPES,
+        'rows': [n[:_POSITION] for n in nodes],
+        'positions': [n[_POSITION] for n in nodes],
+    }
 
-def generate_html():
-    """Generate the complete HTML file."""
-
-    light_nodes, light_edges = generate_light_baryon_data()
-    charm_nodes, charm_edges = generate_charm_baryon_data()
-    bottom_nodes, bottom_edges = generate_bottom_baryon_data()
 
-    # Enrich nodes with pre-calculated mass data
-    enrich_nodes_with_mass_data(light_nodes)
-    enrich_nodes_with_mass_data(charm_nodes)
-    enrich_nodes_with_mass_data(bottom_nodes)
+# Cytoscape renderer, 'canvas' or 'webgl'. WebGL draws nodes and edges in
+# batches, which only pays off for graphs far bigger than these trees, and
+# needs Cytoscape 3.31 or later.
+RENDERER = 'canvas'
 
-    light_nodes_json = json.dumps(light_nodes, indent=8)
-    light_edges_json = json.dumps(light_edges, indent=8)
-    charm_nodes_json = json.dumps(charm_nodes, indent=8)
-    charm_edges_json = json.dumps(charm_edges, indent=8)
-    bottom_nodes_json = json.dumps(bottom_nodes, indent=8)
-    bottom_edges_json = json.dumps(bottom_edges, indent=8)
+# Cytoscape version and renderer options for each RENDERER setting
+_RENDERERS = {
+    'canvas': ('3.28.1', {'name': 'canvas'}),
+    'webgl': ('3.31.0', {'name': 'canvas', 'webgl': True}),
+}
 
-    html = f'''<!DOCTYPE html>
+# Static chunks of the page. The generated data is written between them,
+# so these stay plain strings rather than one big f-string. Styles and
+# scripts live in baryon_tree.css and baryon_tree.js next to the page.
+_HTML_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Baryon π-Algebra Tree</title>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/cytoscape/3.28.1/cytoscape.min.js"></script>
-    <script src="https://unpkg.com/elkjs@0.8.2/lib/elk.bundled.js"></script>
-    <script src="https://unpkg.com/cytoscape-elk@2.2.0/dist/cytoscape-elk.js"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Segoe UI', sans-serif; background: #1a1a2e; color: #eee; }}
-        #container {{ display: flex; height: 100vh; }}
-        #graph-area {{ flex: 1; display: flex; flex-direction: column; }}
-        #main-tabs {{ display: flex; background: #0f0f23; border-bottom: 2px solid #333; }}
-        .main-tab {{
-            padding: 12px 24px; cursor: pointer; color: #888; font-size: 1em;
-            border: none; background: transparent; border-bottom: 3px solid transparent;
-        }}
-        .main-tab:hover {{ color: #ccc; background: #16213e; }}
-        .main-tab.active {{ color: #00d9ff; border-bottom-color: #00d9ff; background: #16213e; }}
-        #cy {{ flex: 1; background: #16213e; }}
-        #sidebar {{ width: 380px; padding: 20px; background: #0f0f23; overflow-y: auto; border-left: 1px solid #333; }}
-        h1 {{ font-size: 1.3em; margin-bottom: 15px; color: #00d9ff; }}
-        h2 {{ font-size: 1em; margin: 15px 0 10px 0; color: #ff6b6b; }}
-        #info {{
-            background: #1a1a2e; padding: 15px; border-radius: 8px;
-            font-family: monospace; font-size: 1.1em; line-height: 1.9;
-        }}
-        .formula {{ color: #00d9ff; font-size: 1.15em; }}
-        .value {{ color: #2ecc71; }}
-        .label {{ color: #888; }}
-        .pos {{ color: #e74c3c; }}
-        .neg {{ color: #3498db; }}
-        button {{ background: #16213e; color: #eee; border: 1px solid #444; padding: 8px 12px; margin: 3px; cursor: pointer; border-radius: 4px; }}
-        button:hover {{ background: #1f4068; border-color: #00d9ff; }}
-        .legend {{ margin-top: 20px; font-size: 0.9em; }}
-        .legend-item {{ display: flex; align-items: center; margin: 8px 0; }}
-        .legend-color {{ width: 20px; height: 20px; border-radius: 4px; margin-right: 10px; border: 2px solid #fff; }}
-        #main-tabs {{ display: flex; justify-content: space-between; align-items: center; }}
-        .tab-buttons {{ display: flex; }}
-        .zoom-controls {{ display: flex; margin-right: 10px; }}
-        .zoom-controls button {{ padding: 6px 12px; margin: 0 2px; }}
-        #decays {{
-            background: #1a1a2e; padding: 15px; border-radius: 8px;
-            margin-top: 15px; font-size: 1.05em; line-height: 1.7;
-        }}
-        .decay-mode {{
-            margin: 8px 0; padding: 8px; background: #16213e;
-            border-radius: 4px; border-left: 3px solid #444;
-        }}
-        .decay-mode.strong {{ border-left-color: #e74c3c; }}
-        .decay-mode.weak {{ border-left-color: #f39c12; }}
-        .decay-mode.em {{ border-left-color: #9b59b6; }}
-        .decay-percent {{ float: right; color: #2ecc71; font-weight: bold; }}
-        .decay-type {{ font-size: 0.75em; color: #888; margin-top: 4px; }}
-    </style>
-</head>
+    <link rel="stylesheet" href="baryon_tree.css">
+'''
+
+_HTML_BODY = '''</head>
 <body>
     <div id="container">
         <div id="graph-area">
@@ -1574,9 +802,9 @@ def generate_html():
                     <button class="main-tab" onclick="switchTab('bottom')">Bottom (36π⁵)</button>
                 </div>
                 <div class="zoom-controls">
-                    <button onclick="cy.zoom(cy.zoom() / 1.2); cy.center()">−</button>
-                    <button onclick="cy.fit(50)">Fit</button>
-                    <button onclick="cy.zoom(cy.zoom() * 1.2); cy.center()">+</button>
+                    <button onclick="cy && (cy.zoom(cy.zoom() / 1.2), cy.center())">−</button>
+                    <button onclick="cy && cy.fit(50)">Fit</button>
+                    <button onclick="cy && (cy.zoom(cy.zoom() * 1.2), cy.center())">+</button>
                 </div>
             </div>
             <div id="cy"></div>
@@ -1601,567 +829,120 @@ def generate_html():
             </div>
         </div>
     </div>
+'''
+
+_HTML_SCRIPT = '''    <script src="baryon_static.js"></script>
     <script>
-        const datasets = {{
-            light: {{ nodes: {light_nodes_json}, edges: {light_edges_json} }},
-            charm: {{ nodes: {charm_nodes_json}, edges: {charm_edges_json} }},
-            bottom: {{ nodes: {bottom_nodes_json}, edges: {bottom_edges_json} }}
-        }};
-        let cy, currentTab = 'light';
-
-        function buildElements(data) {{
-            const elements = [];
-            // Sort nodes by mass so siblings are ordered lightest-to-heaviest
-            const sortedNodes = [...data.nodes].sort((a, b) => {{
-                return (a.actual_mev || 0) - (b.actual_mev || 0);
-            }});
-            sortedNodes.forEach(n => {{
-                let nodeType = n.type;
-                // Distinguish virtual node subtypes:
-                // - 'virtual': strangeness levels (root nodes, empty sublabel) -> ellipse
-                // - 'virtual-coeff': coefficient bases (have sublabel like "Σ base") -> hexagon
-                if (n.type === 'virtual') {{
-                    const isStrangenessLevel = n.id.startsWith('root') || n.sublabel === '';
-                    nodeType = isStrangenessLevel ? 'virtual' : 'virtual-coeff';
-                }}
-                const lbl = (nodeType === 'virtual' || nodeType === 'virtual-coeff')
-                    ? n.label : (n.sublabel ? n.label + '\\n' + n.sublabel : n.label);
-                // Assign partition: 0=octet(left), 1=virtual(center), 2=decuplet(right)
-                let partition = 1; // default: center
-                if (n.type === 'particle') partition = 0;  // octet left
-                if (n.type === 'spin32') partition = 2;    // decuplet right
-                elements.push({{
-                    data: {{ ...n, id: n.id, label: lbl, type: nodeType }},
-                    layoutOptions: {{
-                        'elk.partitioning.partition': partition
-                    }}
-                }});
-            }});
-            data.edges.forEach((e, i) => elements.push({{ data: {{ id: 'e'+i, source: e.source, target: e.target }} }}));
-            return elements;
-        }}
-
-        function initCy(tab) {{
-            const elements = buildElements(datasets[tab]);
-            cy = cytoscape({{
-                container: document.getElementById('cy'),
-                elements: elements,
-                style: [
-                    {{ selector: 'node[type="particle"]', style: {{
-                        'label': 'data(label)', 'text-valign': 'center', 'text-halign': 'center',
-                        'font-size': '20px', 'font-weight': 'bold', 'color': '#fff',
-                        'text-wrap': 'wrap', 'text-max-width': '150px',
-                        'shape': 'round-rectangle', 'width': 130, 'height': 60,
-                        'background-color': '#3498db', 'border-width': 2, 'border-color': '#fff'
-                    }} }},
-                    {{ selector: 'node[type="spin32"]', style: {{
-                        'label': 'data(label)', 'text-valign': 'center', 'text-halign': 'center',
-                        'font-size': '20px', 'font-weight': 'bold', 'color': '#fff',
-                        'text-wrap': 'wrap', 'text-max-width': '150px',
-                        'shape': 'round-rectangle', 'width': 130, 'height': 60,
-                        'background-color': '#e74c3c', 'border-width': 2, 'border-color': '#fff'
-                    }} }},
-                    {{ selector: 'node[type="virtual"]', style: {{
-                        'label': 'data(label)', 'text-valign': 'center', 'text-halign': 'center',
-                        'font-size': '20px', 'color': '#fff', 'text-wrap': 'wrap',
-                        'shape': 'ellipse', 'width': 85, 'height': 85, 'background-color': '#9b59b6',
-                        'border-width': 2, 'border-style': 'dashed', 'border-color': '#fff'
-                    }} }},
-                    {{ selector: 'node[type="virtual-coeff"]', style: {{
-                        'label': 'data(label)', 'text-valign': 'center', 'text-halign': 'center',
-                        'font-size': '20px', 'color': '#fff', 'text-wrap': 'wrap',
-                        'shape': 'hexagon', 'width': 95, 'height': 95, 'background-color': '#8e44ad',
-                        'border-width': 2, 'border-style': 'solid', 'border-color': '#fff'
-                    }} }},
-                    {{ selector: 'edge', style: {{ 'width': 2, 'line-color': '#555', 'target-arrow-color': '#555', 'target-arrow-shape': 'triangle', 'curve-style': 'bezier' }} }},
-                    {{ selector: 'node:selected', style: {{ 'border-color': '#00d9ff', 'border-width': 5 }} }}
-                ],
-                layout: {{
-                    name: 'elk',
-                    elk: {{
-                        algorithm: 'layered',
-                        'elk.direction': 'DOWN',
-                        'elk.spacing.nodeNode': 60,
-                        'elk.layered.spacing.nodeNodeBetweenLayers': 100,
-                        'elk.partitioning.activate': true,
-                        'elk.layered.crossingMinimization.strategy': 'LAYER_SWEEP',
-                        'elk.layered.considerModelOrder.strategy': 'NODES_AND_EDGES'
-                    }},
-                    padding: 30
-                }}
-            }});
-            cy.on('tap', 'node', e => showInfo(e.target.data()));
-            cy.on('tap', e => {{ if(e.target === cy) document.getElementById('info').innerHTML = '<p style="color:#666">Click a node</p>'; }});
-
-            // Set default zoom per tab
-            cy.one('layoutstop', () => {{
-                if (tab === 'bottom') {{
-                    cy.zoom(0.8);
-                    cy.center();
-                }}
-            }});
-        }}
-
-        // Magnetic moments from data/magnetic.py
-        const magMoments = {{
-{generate_magnetic_moments_js()}
-        }};
-
-        // Resonances from data/resonances.py
-        const resonances = {{
-{generate_resonances_js()}
-        }};
-
-        // Virtual node to resonance mapping from data/cycle.py
-        const nodeResonances = {{
-{generate_node_resonances_js()}
-        }};
-
-        // Mesons from data/mesons.py
-        const mesons = {{
-{generate_mesons_js()}
-        }};
-
-        // Virtual node to meson mapping from data/cycle.py
-        const nodeMesons = {{
-{generate_node_mesons_js()}
-        }};
-
-        function getSigmaColor(sigma) {{
-            if (sigma < 1) return '#2ecc71';      // green
-            if (sigma < 2) return '#3498db';      // blue
-            if (sigma < 3) return '#f39c12';      // orange
-            return '#e74c3c';                      // red
-        }}
-
-        function showInfo(d) {{
-            if (d.type === 'virtual' || d.type === 'virtual-coeff') {{
-                // Get resonances for this virtual node
-                const resKeys = nodeResonances[d.id] || [];
-                let resHtml = '';
-
-                if (resKeys.length > 0) {{
-                    resHtml = `<hr style="border-color:#333; margin:12px 0">
-                        <div style="color:#e74c3c; font-size:0.9em; margin-bottom:8px;">RESONANCES</div>`;
-
-                    for (const key of resKeys) {{
-                        const res = resonances[key];
-                        if (res) {{
-                            const errorSign = res.error_kev >= 0 ? '+' : '';
-                            resHtml += `
-                                <div style="margin-bottom:12px; padding:10px; background:#252540; border-radius:4px;">
-                                    <div style="font-size:1.4em; color:#fff; margin-bottom:4px;">${{res.symbol}} <span style="font-size:0.5em; color:#888; margin-left:4px;">${{res.jp}}</span></div>
-                                    <div style="font-size:1.0em; margin-bottom:4px; display:flex; justify-content:space-between;">
-                                        <span class="formula">${{res.formula}}</span>
-                                        <span style="color:#888">${{res.calc_mev.toFixed(2)}}</span>
-                                    </div>
-                                    <div style="font-size:0.85em; color:#888; margin-bottom:6px;">
-                                        <span>Exp: ${{res.exp_mev}} MeV</span>
-                                        <span style="margin-left:12px; color:${{Math.abs(res.error_kev) < 50 ? '#2ecc71' : '#f39c12'}}">${{errorSign}}${{res.error_kev.toFixed(1)}} keV</span>
-                                    </div>
-                                    <div style="font-size:0.85em; color:#888; margin-bottom:6px;">
-                                        <span>Width Γ = ${{res.width}} MeV</span>
-                                    </div>
-                                    <div style="font-size:0.8em; color:#f39c12; font-style:italic; line-height:1.4;">${{res.anomaly}}</div>
-                                </div>`;
-                        }}
-                    }}
-                }}
-
-                // Get mesons for this virtual node
-                const mesonKeys = nodeMesons[d.id] || [];
-                let mesonHtml = '';
-
-                if (mesonKeys.length > 0) {{
-                    mesonHtml = `<hr style="border-color:#333; margin:12px 0">
-                        <div style="color:#2ecc71; font-size:0.9em; margin-bottom:8px;">MESONS</div>`;
-
-                    for (const key of mesonKeys) {{
-                        const m = mesons[key];
-                        if (m) {{
-                            const errorSign = m.error_kev >= 0 ? '+' : '';
-                            mesonHtml += `
-                                <div style="margin-bottom:12px; padding:10px; background:#1a3a2a; border-radius:4px; border-left:3px solid #2ecc71;">
-                                    <div style="font-size:1.4em; color:#fff; margin-bottom:4px;">${{m.symbol}} <span style="font-size:0.6em; color:#888; margin-left:4px;">${{m.quark_content}}</span></div>
-                                    <div style="font-size:1.0em; margin-bottom:4px; display:flex; justify-content:space-between;">
-                                        <span class="formula">${{m.formula}}</span>
-                                        <span style="color:#888">${{m.calc_mev.toFixed(2)}}</span>
-                                    </div>
-                                    <div style="font-size:0.85em; color:#888; margin-bottom:6px;">
-                                        <span>Exp: ${{m.exp_mev}} MeV</span>
-                                        <span style="margin-left:12px; color:${{Math.abs(m.error_kev) < 500 ? '#2ecc71' : '#f39c12'}}">${{errorSign}}${{m.error_kev.toFixed(1)}} keV</span>
-                                    </div>
-                                </div>`;
-                        }}
-                    }}
-                }}
-
-                document.getElementById('info').innerHTML = `
-                    <div style="font-size:1.8em; margin-bottom:5px; color:#fff">${{d.label}}</div>
-                    <div style="font-size:1.3em; margin-bottom:8px;"><span class="formula">${{d.formula}}</span></div>
-                    <div style="color:#888; font-size:0.9em;">${{d.description || ''}}</div>
-                    ${{resHtml}}
-                    ${{mesonHtml}}`;
-            }} else {{
-                const fullFormula = d.correction ? d.formula + ' ' + d.correction : d.formula;
-                // Use pre-calculated values from Python
-                const calcMev = d.calc_mev || 0;
-                const expMev = d.actual_mev || 0;
-                const errorKev = d.error_kev || 0;
-                const unc = d.uncertainty || 1.0;
-                const sigma = d.sigma || 0;
-                const sigmaColor = getSigmaColor(sigma);
-                const sigmaText = sigma < 100 ? sigma.toFixed(2) + 'σ' : '>100σ';
-                const errorSign = errorKev >= 0 ? '+' : '';
-
-                // Build magnetic moment section if data exists
-                let magHtml = '';
-                const mm = magMoments[d.id];
-                if (mm) {{
-                    const magError = ((mm.value - mm.exp) / mm.exp * 100).toFixed(2);
-                    magHtml = `
-                        <hr style="border-color: #333; margin: 12px 0;">
-                        <div style="color: #f39c12; font-size: 0.9em; margin-bottom: 5px;">MAGNETIC MOMENT</div>
-                        <div><span class="label">μ formula:</span> <span style="color: #f39c12;">${{mm.formula}}</span></div>
-                        <div><span class="label">Calculated:</span> ${{mm.sign}}${{mm.value.toFixed(3)}} ${{mm.unit}}</div>
-                        <div><span class="label">Experimental:</span> ${{mm.sign}}${{mm.exp}} ${{mm.unit}}</div>
-                        <div><span class="label">Error:</span> ${{magError}}%</div>
-                    `;
-                }}
-
-                const baseMev = d.base_mev || 0;
-                const corrMev = d.corr_mev || 0;
-                const hasCorr = d.correction && corrMev !== 0;
-
-                document.getElementById('info').innerHTML = `
-                    <div style="font-size:1.8em; margin-bottom:5px; color:#fff">${{d.label.split('\\n')[0]}} <span style="font-size:0.55em; color:#888; margin-left:6px">${{d.quarks ? '(' + d.quarks + ')' : ''}} ${{d.spin}}<sup>${{d.charge > 0 ? '+' : d.charge < 0 ? '−' : '0'}}</sup></span></div>
-                    <div style="font-size:1.1em; margin-bottom:4px; display:flex; justify-content:space-between;">
-                        <span class="formula">${{d.formula}}</span>
-                        <span style="color:#888; margin-left:12px">${{baseMev.toFixed(2)}}</span>
-                    </div>
-                    ${{hasCorr ? `<div style="font-size:1.1em; margin-bottom:8px; display:flex; justify-content:space-between;">
-                        <span class="formula">${{d.correction}}</span>
-                        <span style="color:#888; margin-left:12px">${{corrMev >= 0 ? '+' : ''}}${{corrMev.toFixed(2)}}</span>
-                    </div>` : ''}}
-                    <hr style="border-color:#333; margin:12px 0">
-                    <div><span class="label">Calculated:</span> <span class="value">${{calcMev.toFixed(4)}} MeV</span></div>
-                    <div><span class="label">Experimental:</span> <span class="value">${{expMev.toFixed(4)}} MeV</span></div>
-                    <div><span class="label">Uncertainty:</span> <span class="value">±${{unc < 0.001 ? (unc*1e6).toFixed(2) + ' eV' : unc < 1 ? (unc*1000).toFixed(1) + ' keV' : unc.toFixed(2) + ' MeV'}}</span></div>
-                    <hr style="border-color:#333; margin:12px 0">
-                    <div><span class="label">Error:</span> <span style="color:${{sigmaColor}}">${{errorSign}}${{Math.abs(errorKev) < 1 ? (errorKev*1000).toFixed(1) + ' eV' : errorKev.toFixed(2) + ' keV'}}</span></div>
-                    <div><span class="label">Deviation:</span> <span style="color:${{sigmaColor}}; font-weight:bold">${{sigmaText}}</span></div>
-                    ${{magHtml}}`;
-
-                updateDecays(d.id);
-            }}
-        }}
-
-        function switchTab(tab) {{
-            currentTab = tab;
-            document.querySelectorAll('.main-tab').forEach(t => t.classList.remove('active'));
-            event.target.classList.add('active');
-            cy.destroy();
-            initCy(tab);
-            document.getElementById('info').innerHTML = '<p style="color:#666">Click a node</p>';
-            document.getElementById('decays').innerHTML = '<p style="color:#666">Select a particle to see decay modes</p>';
-        }}
-
-        // Decay database (keys match node_id values)
-        const decayData = {{
-            'p': {{ stable: true, lifetime: '> 10³⁴ years' }},
-            'n': {{
-                lifetime: '~879 s (15 min)',
-                note: 'Longest weak decay! Tiny Q-value (782 keV).',
-                modes: [
-                    {{ products: 'p + e⁻ + ν̄ₑ', percent: 100, type: 'weak' }}
-                ]
-            }},
-            'D': {{
-                lifetime: '~5×10⁻²⁴ s',
-                note: 'Resonance, decays via strong force',
-                modes: [
-                    {{ products: 'N + π', percent: 99.4, type: 'strong' }},
-                    {{ products: 'N + γ', percent: 0.6, type: 'em' }}
-                ]
-            }},
-            'L0': {{
-                lifetime: '2.6×10⁻¹⁰ s',
-                modes: [
-                    {{ products: 'p + π⁻', percent: 63.9, type: 'weak' }},
-                    {{ products: 'n + π⁰', percent: 35.8, type: 'weak' }}
-                ]
-            }},
-            'S_plus': {{
-                lifetime: '0.80×10⁻¹⁰ s',
-                modes: [
-                    {{ products: 'p + π⁰', percent: 51.6, type: 'weak' }},
-                    {{ products: 'n + π⁺', percent: 48.3, type: 'weak' }}
-                ]
-            }},
-            'S_zero': {{
-                lifetime: '7.4×10⁻²⁰ s',
-                note: 'EM decay! Only ground-state baryon.',
-                modes: [
-                    {{ products: 'Λ + γ', percent: 100, type: 'em' }}
-                ]
-            }},
-            'S_minus': {{
-                lifetime: '1.48×10⁻¹⁰ s',
-                modes: [
-                    {{ products: 'n + π⁻', percent: 99.8, type: 'weak' }}
-                ]
-            }},
-            'Ss_plus': {{
-                lifetime: '~1.7×10⁻²³ s',
-                modes: [
-                    {{ products: 'Λ + π⁺', percent: 87, type: 'strong' }},
-                    {{ products: 'Σ + π', percent: 12, type: 'strong' }}
-                ]
-            }},
-            'Ss_zero': {{
-                lifetime: '~1.7×10⁻²³ s',
-                modes: [
-                    {{ products: 'Λ + π⁰', percent: 87, type: 'strong' }},
-                    {{ products: 'Σ + π', percent: 12, type: 'strong' }}
-                ]
-            }},
-            'Ss_minus': {{
-                lifetime: '~1.7×10⁻²³ s',
-                modes: [
-                    {{ products: 'Λ + π⁻', percent: 87, type: 'strong' }},
-                    {{ products: 'Σ + π', percent: 12, type: 'strong' }}
-                ]
-            }},
-            'X_zero': {{
-                lifetime: '2.9×10⁻¹⁰ s',
-                modes: [
-                    {{ products: 'Λ + π⁰', percent: 99.5, type: 'weak' }}
-                ]
-            }},
-            'X_minus': {{
-                lifetime: '1.6×10⁻¹⁰ s',
-                modes: [
-                    {{ products: 'Λ + π⁻', percent: 99.9, type: 'weak' }}
-                ]
-            }},
-            'Xs_zero': {{
-                lifetime: '~7×10⁻²³ s',
-                modes: [
-                    {{ products: 'Ξ + π', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Xs_minus': {{
-                lifetime: '~7×10⁻²³ s',
-                modes: [
-                    {{ products: 'Ξ + π', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Om': {{
-                lifetime: '0.82×10⁻¹⁰ s',
-                note: 'Spin-3/2 but NO strong decay!',
-                modes: [
-                    {{ products: 'Λ + K⁻', percent: 67.8, type: 'weak' }},
-                    {{ products: 'Ξ⁰ + π⁻', percent: 23.6, type: 'weak' }},
-                    {{ products: 'Ξ⁻ + π⁰', percent: 8.6, type: 'weak' }}
-                ]
-            }},
-            'Lc': {{
-                lifetime: '2.0×10⁻¹³ s',
-                modes: [
-                    {{ products: 'Λ + π⁺ + ...', percent: 35, type: 'weak' }},
-                    {{ products: 'pK̄⁰', percent: 3.2, type: 'weak' }}
-                ]
-            }},
-            'Lb': {{
-                lifetime: '1.5×10⁻¹² s',
-                note: 'Longest-lived bottom baryon',
-                modes: [
-                    {{ products: 'Λc⁺ + π⁻', percent: 0.5, type: 'weak' }},
-                    {{ products: 'Λc⁺ + π⁻ + π⁺ + π⁻', percent: 2.6, type: 'weak' }},
-                    {{ products: 'J/ψ + Λ', percent: 0.04, type: 'weak' }},
-                    {{ products: 'p + π⁻', percent: 0.0004, type: 'weak' }}
-                ]
-            }},
-            // Charm baryons
-            'Sc_pp': {{
-                lifetime: '~2×10⁻²² s',
-                note: 'Strong decay to Λc⁺',
-                modes: [
-                    {{ products: 'Λc⁺ + π⁺', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Sc_plus': {{
-                lifetime: '~5×10⁻²¹ s',
-                note: 'EM decay (isospin forbids strong)',
-                modes: [
-                    {{ products: 'Λc⁺ + γ', percent: 100, type: 'em' }}
-                ]
-            }},
-            'Sc_zero': {{
-                lifetime: '~2×10⁻²² s',
-                note: 'Strong decay to Λc⁺',
-                modes: [
-                    {{ products: 'Λc⁺ + π⁻', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Scs_pp': {{
-                lifetime: '~5×10⁻²³ s',
-                modes: [
-                    {{ products: 'Λc⁺ + π⁺', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Scs_plus': {{
-                lifetime: '~5×10⁻²³ s',
-                modes: [
-                    {{ products: 'Λc⁺ + π⁰', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Scs_zero': {{
-                lifetime: '~5×10⁻²³ s',
-                modes: [
-                    {{ products: 'Λc⁺ + π⁻', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Xc_plus': {{
-                lifetime: '4.6×10⁻¹³ s',
-                modes: [
-                    {{ products: 'Ξ⁻ + π⁺ + π⁺', percent: 2.9, type: 'weak' }},
-                    {{ products: 'pK⁻π⁺', percent: 1.1, type: 'weak' }}
-                ]
-            }},
-            'Xc_zero': {{
-                lifetime: '1.5×10⁻¹³ s',
-                note: 'Shorter-lived than Ξc⁺',
-                modes: [
-                    {{ products: 'Ξ⁻ + π⁺', percent: 1.8, type: 'weak' }},
-                    {{ products: 'pK⁻K⁻π⁺', percent: 0.6, type: 'weak' }}
-                ]
-            }},
-            'Xcs_plus': {{
-                lifetime: '~3×10⁻²¹ s',
-                modes: [
-                    {{ products: 'Ξc⁰ + π⁺', percent: 50, type: 'strong' }},
-                    {{ products: 'Ξc⁺ + π⁰', percent: 50, type: 'strong' }}
-                ]
-            }},
-            'Xcs_zero': {{
-                lifetime: '~3×10⁻²¹ s',
-                modes: [
-                    {{ products: 'Ξc⁺ + π⁻', percent: 50, type: 'strong' }},
-                    {{ products: 'Ξc⁰ + π⁰', percent: 50, type: 'strong' }}
-                ]
-            }},
-            'Oc_zero': {{
-                lifetime: '2.7×10⁻¹³ s',
-                modes: [
-                    {{ products: 'Ω⁻ + π⁺', percent: 0.5, type: 'weak' }},
-                    {{ products: 'Ξ⁰ + K⁻ + π⁺', percent: 0.5, type: 'weak' }}
-                ]
-            }},
-            'Ocs_zero': {{
-                lifetime: '~10⁻²¹ s',
-                modes: [
-                    {{ products: 'Ωc⁰ + γ', percent: 100, type: 'em' }}
-                ]
-            }},
-            'Xcc': {{
-                lifetime: '2.6×10⁻¹³ s',
-                note: 'Double charm baryon',
-                modes: [
-                    {{ products: 'Λc⁺ + K⁻ + π⁺ + π⁺', percent: 5.9, type: 'weak' }},
-                    {{ products: 'Ξc⁺ + π⁺', percent: 1.0, type: 'weak' }}
-                ]
-            }},
-            // Bottom baryons
-            'Sb_plus': {{
-                lifetime: '~6×10⁻²² s',
-                note: 'Strong decay to Λb⁰',
-                modes: [
-                    {{ products: 'Λb⁰ + π⁺', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Sb_minus': {{
-                lifetime: '~6×10⁻²² s',
-                note: 'Strong decay to Λb⁰',
-                modes: [
-                    {{ products: 'Λb⁰ + π⁻', percent: 100, type: 'strong' }}
-                ]
-            }},
-            'Sbs_plus': {{
-                lifetime: '~10⁻²⁰ s',
-                note: 'EM decay (20 MeV splitting)',
-                modes: [
-                    {{ products: 'Σb⁺ + γ', percent: 100, type: 'em' }}
-                ]
-            }},
-            'Sbs_minus': {{
-                lifetime: '~10⁻²⁰ s',
-                note: 'EM decay (19 MeV splitting)',
-                modes: [
-                    {{ products: 'Σb⁻ + γ', percent: 100, type: 'em' }}
-                ]
-            }},
-            'Xb_zero': {{
-                lifetime: '1.5×10⁻¹² s',
-                modes: [
-                    {{ products: 'Ξc⁺ + π⁻', percent: 1.0, type: 'weak' }},
-                    {{ products: 'J/ψ + Ξ⁰', percent: 0.1, type: 'weak' }}
-                ]
-            }},
-            'Xb_minus': {{
-                lifetime: '1.6×10⁻¹² s',
-                modes: [
-                    {{ products: 'Ξc⁰ + π⁻', percent: 1.0, type: 'weak' }},
-                    {{ products: 'J/ψ + Ξ⁻', percent: 0.1, type: 'weak' }}
-                ]
-            }},
-            'Ob': {{
-                lifetime: '1.6×10⁻¹² s',
-                note: 'Bottom + double strange',
-                modes: [
-                    {{ products: 'J/ψ + Ω⁻', percent: 0.3, type: 'weak' }},
-                    {{ products: 'Ωc⁰ + π⁻', percent: 0.5, type: 'weak' }}
-                ]
-            }}
-        }};
-
-        function updateDecays(id) {{
-            const decay = decayData[id];
-            let html = '';
-
-            if (!decay) {{
-                html = '<p style="color: #666;">No decay data for this particle</p>';
-            }} else if (decay.stable) {{
-                html = `<div style="color: #2ecc71; font-size: 1.1em;">STABLE</div>
-                        <div style="color: #888; margin-top: 5px;">τ ${{decay.lifetime}}</div>`;
-            }} else {{
-                html = `<div style="color: #888; margin-bottom: 10px;">τ = ${{decay.lifetime}}</div>`;
-                if (decay.note) {{
-                    html += `<div style="color: #f39c12; margin-bottom: 10px; font-size: 0.9em;">${{decay.note}}</div>`;
-                }}
-                decay.modes.forEach(m => {{
-                    const percent = typeof m.percent === 'number' ? m.percent.toFixed(1) + '%' : m.percent;
-                    html += `
-                        <div class="decay-mode ${{m.type}}">
-                            <span class="decay-percent">${{percent}}</span>
-                            ${{m.products}}
-                        </div>
-                    `;
-                }});
-            }}
-
-            document.getElementById('decays').innerHTML = html;
-        }}
-
-        initCy('light');
-    </script>
+'''
+
+_HTML_TAIL = '''    </script>
+    <script src="baryon_tree.js"></script>
 </body>
 </html>'''
-    return html
+
+# (comment, JS const name, generator) for the lookup tables in the page
+_JS_TABLES = (
+    ('Resonances from data/resonances.py', 'resonances', generate_resonances_js),
+    ('Virtual node to resonance mapping from data/cycle.py', 'nodeResonances', generate_node_resonances_js),
+    ('Mesons from data/mesons.py', 'mesons', generate_mesons_js),
+    ('Virtual node to meson mapping from data/cycle.py', 'nodeMesons', generate_node_mesons_js),
+)
+
+
+def write_html(f):
+    """Write the complete HTML page to a text file object.
+
+    The node and edge payloads are encoded straight into f rather than
+    being built up as strings first.
+    """
+    datasets = [
+        ('light', generate_light_baryon_data()),
+        ('charm', generate_charm_baryon_data()),
+        ('bottom', generate_bottom_baryon_data()),
+    ]
+
+    version, renderer = _RENDERERS[RENDERER]
+    f.write(_HTML_HEAD)
+    f.write(f'    <script defer src="https://cdnjs.cloudflare.com/ajax/libs/cytoscape/{version}/cytoscape.min.js"></script>\n')
+    f.write(_HTML_BODY)
+
+    # Not executed as script, so the page only parses the tabs it shows
+    for tab, (nodes, edges) in datasets:
+        f.write(f'    <script type="application/json" id="data-{tab}">{{"nodes":')
+        _dump(pack_nodes(nodes), f)
+        f.write(',"edges":')
+        _dump(edges, f)
+        f.write('}</script>\n')
+
+    f.write(_HTML_SCRIPT)
+    f.write(''.join(
+        f'        // {comment}\n        const {name} = {{\n{generate()}\n        }};\n\n'
+        for comment, name, generate in _JS_TABLES
+    ))
+    f.write(f'        // Renderer options, see RENDERER in the generator\n'
+            f'        const cyRenderer = {json.dumps(renderer)};\n')
+    f.write(_HTML_TAIL)
+
+
+def write_static_js(f):
+    """Write baryon_static.js, the tables that do not change between builds.
+
+    The browser caches it apart from the page.
+    """
+    f.write('// Decay database from data/decays.py (keys match node_id values)\n')
+    f.write('const decayData = ')
+    _dump(DECAYS, f)
+    f.write(';\n\n')
+    f.write('// Magnetic moments from data/magnetic.py\n')
+    f.write(f'const magMoments = {{\n{generate_magnetic_moments_js()}\n}};\n')
+
+
+def generate_html():
+    """Generate the complete HTML file as a string.
+
+    Kept for callers that want the page in memory; the script itself
+    streams it to disk with write_if_changed.
+    """
+    buf = io.StringIO()
+    write_html(buf)
+    return buf.getvalue()
+
+
+def _same_contents(a, b):
+    """Whether two files hold the same bytes; False if b does not exist."""
+    try:
+        with open(a, 'rb') as fa, open(b, 'rb') as fb:
+            return fa.read() == fb.read()
+    except FileNotFoundError:
+        return False
+
+
+def write_if_changed(path, write):
+    """Stream write into a temporary file and move it over path if it differs.
+
+    Output is deterministic, so an unchanged file keeps its mtime and the
+    browser's cached copy stays valid. Returns True if the file was written.
+    """
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            write(f)
+        unchanged = _same_contents(tmp, path)
+    except BaseException:
+        # Don't leave a half-written temp file in the tree
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    if unchanged:
+        os.remove(tmp)
+        return False
+    os.replace(tmp, path)
+    return True
 
 
 if __name__ == '__main__':
-    html = generate_html()
-    with open('baryon_tree.html', 'w', encoding='utf-8') as f:
-        f.write(html)
-    print("Generated baryon_tree.html")
+    for path, write in (('baryon_tree.html', write_html), ('baryon_static.js', write_static_js)):
+        if write_if_changed(path, write):
+            print(f"Generated {path}")
+        else:
+            print(f"{path} is up to date")